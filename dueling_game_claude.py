@@ -24,6 +24,11 @@ screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 pygame.display.set_caption("Top-Down Battle Game")
 clock = pygame.time.Clock()
 
+# Darkening overlay for the game over screen, built once
+GAME_OVER_OVERLAY = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+GAME_OVER_OVERLAY.fill((0, 0, 0, 200))
+GAME_OVER_OVERLAY = GAME_OVER_OVERLAY.convert_alpha()
+
 # Game state
 game_state = "menu"  # Can be "menu", "equipment_select", "game", "game_over"
 highscore = 0
@@ -35,15 +40,29 @@ font_small = pygame.font.SysFont("Arial", 16)
 font_medium = pygame.font.SysFont("Arial", 24)
 font_large = pygame.font.SysFont("Arial", 36)
 
+# Cached RNG bound methods for hot loops (avoids module attribute lookups)
+_rng = random.Random()
+_uniform = _rng.uniform
+_randint = _rng.randint
+
 # Equipment options
 EQUIPMENT_TYPES = ["sword", "shield", "dagger", "bare_hand"]
 
-# Layer groups for rendering order
-ground_layer = pygame.sprite.Group()
-splatter_layer = pygame.sprite.Group()
-object_layer = pygame.sprite.Group()
-effect_layer = pygame.sprite.Group()  # For visual effects
-roof_layer = pygame.sprite.Group()
+# Equipment select button layout (static, so computed once)
+LEFT_EQUIPMENT_RECTS = [pygame.Rect(WINDOW_WIDTH/4 - 100, 150 + i * 60, 200, 40) for i in range(len(EQUIPMENT_TYPES))]
+RIGHT_EQUIPMENT_RECTS = [pygame.Rect(3*WINDOW_WIDTH/4 - 100, 150 + i * 60, 200, 40) for i in range(len(EQUIPMENT_TYPES))]
+equipment_select_panel = None  # Rendered lazily on first draw
+button_highlight = None
+
+# Rendering layers, from back to front
+GROUND_LAYER = 0
+SPLATTER_LAYER = 1
+OBJECT_LAYER = 2
+EFFECT_LAYER = 3  # For visual effects
+ROOF_LAYER = 4
+
+# Single layered group; iterating it yields sprites in rendering order
+world = pygame.sprite.LayeredUpdates()
 
 # Collision groups
 characters = pygame.sprite.Group()
@@ -57,9 +76,9 @@ class BlockEffect(pygame.sprite.Sprite):
         self.radius = 15
         self.lifetime = 0.3  # in seconds
         self.timer = self.lifetime
-        self.image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+        self.image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA).convert_alpha()
         self.rect = self.image.get_rect(center=position)
-        effect_layer.add(self)
+        world.add(self, layer=EFFECT_LAYER)
         
     def update(self):
         self.timer -= 1/FPS
@@ -86,7 +105,7 @@ class Entity(pygame.sprite.Sprite):
         self.x = x
         self.y = y
         self.radius = radius
-        self.image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        self.image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA).convert_alpha()
         self.rect = self.image.get_rect(center=(x, y))
         self.velocity = pygame.math.Vector2(0, 0)
         self.body_rotation = 0
@@ -372,7 +391,7 @@ class Character(Entity):
         self.right_equipped = None
         self.fixed_rotation = False
         characters.add(self)
-        object_layer.add(self)
+        world.add(self, layer=OBJECT_LAYER)
         
     def equip(self, equipment_type, side):
         if side == "left":
@@ -472,10 +491,9 @@ class Character(Entity):
             attacker.right_arm.is_blocked = True
             
         # Create a visual block effect
-        block_effect = BlockEffect(
+        BlockEffect(
             attacker.left_arm.hand_position if blocked_arm == "left" else attacker.right_arm.hand_position
         )
-        object_layer.add(block_effect)
     
     def take_damage(self, amount):
         self.health -= amount
@@ -483,7 +501,7 @@ class Character(Entity):
         # Create blood splatter
         for _ in range(amount * 5):
             splatter = BloodSplatter(self.x, self.y)
-            splatter_layer.add(splatter)
+            world.add(splatter, layer=SPLATTER_LAYER)
             
         # Apply knockback from damage
         knockback_dir = pygame.math.Vector2(
@@ -500,7 +518,7 @@ class Character(Entity):
         # Create death effect
         for _ in range(20):
             splatter = BloodSplatter(self.x, self.y)
-            splatter_layer.add(splatter)
+            world.add(splatter, layer=SPLATTER_LAYER)
             
         # Remove from all groups
         self.kill()
@@ -665,7 +683,7 @@ class Enemy(Character):
                     self.change_state()
             
             # Avoid campfire and other dangers
-            for obj in object_layer:
+            for obj in world.get_sprites_from_layer(OBJECT_LAYER):
                 if isinstance(obj, Campfire) and obj != self:
                     obj_dx = obj.x - self.x
                     obj_dy = obj.y - self.y
@@ -756,6 +774,7 @@ class BloodSplatter(pygame.sprite.Sprite):
         self.color = (BLOOD_RED[0], BLOOD_RED[1], BLOOD_RED[2], random.randint(100, 200))
         self.image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
         pygame.draw.circle(self.image, self.color, (self.radius, self.radius), self.radius)
+        self.image = self.image.convert_alpha()
         self.rect = self.image.get_rect(center=(self.x, self.y))
         self.lifetime = random.uniform(5, 15)
         
@@ -778,11 +797,35 @@ class Campfire(pygame.sprite.Sprite):
         self.flame_direction = 1
         self.animation_speed = 0.3
         self.flame_flicker = 0
-        self.image = pygame.Surface((self.base_size + 20, self.base_size + self.flame_height + 10), pygame.SRCALPHA)
+        self.image = pygame.Surface((self.base_size + 20, self.base_size + self.flame_height + 10), pygame.SRCALPHA).convert_alpha()
         self.rect = self.image.get_rect(center=(x, y))
         self.damage_radius = self.base_size
         self.damage_timer = 0
-        ground_layer.add(self)
+        world.add(self, layer=GROUND_LAYER)
+        
+        # Pre-render fire glow (it never changes)
+        self.glow_surfaces = []
+        for i in range(3):
+            glow_size = self.base_size + i * 10
+            glow_color = (255, 100, 0, 50 - i * 15)
+            glow_surf = pygame.Surface((glow_size*2, glow_size*2), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
+            self.glow_surfaces.append((glow_surf.convert_alpha(), glow_size))
+        
+        # Time-invariant geometry, precomputed as integers for the draw calls
+        self.base_rect = pygame.Rect(self.x - self.base_size/2, self.y - self.base_size/2,
+                                     self.base_size, self.base_size)
+        self.log_rects = (
+            pygame.Rect(self.x - self.base_size*0.7, self.y - self.base_size*0.2,
+                        self.base_size*1.4, self.base_size*0.4),
+            pygame.Rect(self.x - self.base_size*0.2, self.y - self.base_size*0.7,
+                        self.base_size*0.4, self.base_size*1.4)
+        )
+        self.flame_x = int(self.x)
+        self.flame_bl = (int(self.x - self.base_size/2), int(self.y))
+        self.flame_br = (int(self.x + self.base_size/2), int(self.y))
+        self.inner_flame_bl = (int(self.x - self.base_size/4), int(self.y))
+        self.inner_flame_br = (int(self.x + self.base_size/4), int(self.y))
         
         # Create fire embers
         self.embers = []
@@ -801,72 +844,66 @@ class Campfire(pygame.sprite.Sprite):
         if abs(self.flame_tip_offset) > 5:
             self.flame_direction *= -1
             
+        uniform = _uniform
+        
         # Random flicker effect
-        self.flame_flicker = random.uniform(-2, 2)
+        self.flame_flicker = uniform(-2, 2)
             
         # Update embers
+        half_base = self.base_size/2
+        top_y = self.y - self.flame_height - 20
         for ember in self.embers:
             ember['y'] -= ember['speed']
-            ember['alpha'] -= random.uniform(1, 3)
+            ember['alpha'] -= uniform(1, 3)
             
             # Reset ember when it fades or rises too high
-            if ember['alpha'] <= 0 or ember['y'] < self.y - self.flame_height - 20:
-                ember['x'] = self.x + random.uniform(-self.base_size/2, self.base_size/2)
-                ember['y'] = self.y - random.uniform(0, 5)
-                ember['size'] = random.uniform(1, 3)
-                ember['alpha'] = random.randint(150, 255)
+            if ember['alpha'] <= 0 or ember['y'] < top_y:
+                ember['x'] = self.x + uniform(-half_base, half_base)
+                ember['y'] = self.y - uniform(0, 5)
+                ember['size'] = uniform(1, 3)
+                ember['alpha'] = _randint(150, 255)
                 
         # Check for characters in fire
         self.damage_timer -= 1/60
         if self.damage_timer <= 0:
             self.damage_timer = 0.5  # Damage every half second
+            radius = self.damage_radius
             for character in characters:
                 dx = character.x - self.x
                 dy = character.y - self.y
-                distance = math.sqrt(dx**2 + dy**2)
-                
-                if distance < self.damage_radius:
+
+                # Cheap bounding box reject before the exact distance test
+                if abs(dx) >= radius or abs(dy) >= radius:
+                    continue
+                if dx*dx + dy*dy < radius*radius:
                     character.take_damage(1)
         
     def draw(self, surface):
         # Draw base (brown square)
-        pygame.draw.rect(surface, BROWN, 
-                        pygame.Rect(self.x - self.base_size/2, self.y - self.base_size/2, 
-                                   self.base_size, self.base_size))
+        pygame.draw.rect(surface, BROWN, self.base_rect)
         
         # Draw logs crossing the fire
         log_color = (100, 50, 20)
-        pygame.draw.rect(surface, log_color, 
-                        pygame.Rect(self.x - self.base_size*0.7, 
-                                   self.y - self.base_size*0.2, 
-                                   self.base_size*1.4, 
-                                   self.base_size*0.4))
-        pygame.draw.rect(surface, log_color, 
-                        pygame.Rect(self.x - self.base_size*0.2, 
-                                   self.y - self.base_size*0.7, 
-                                   self.base_size*0.4, 
-                                   self.base_size*1.4))
-        
-        # Draw flames (red triangle with yellow inside)
-        flame_points = [
-            (self.x, self.y - self.flame_height - self.flame_tip_offset + self.flame_flicker),  # Top
-            (self.x - self.base_size/2, self.y),  # Bottom left
-            (self.x + self.base_size/2, self.y)   # Bottom right
-        ]
+        for log_rect in self.log_rects:
+            pygame.draw.rect(surface, log_color, log_rect)
+        
+        # Draw flames (red triangle with yellow inside); only the tips move
+        tip_offset = self.flame_tip_offset - self.flame_flicker
+        flame_points = (
+            (self.flame_x, int(self.y - self.flame_height - tip_offset)),  # Top
+            self.flame_bl,
+            self.flame_br
+        )
         
         # Inner flame (yellow)
-        inner_flame_points = [
-            (self.x, self.y - (self.flame_height/1.5) - self.flame_tip_offset/1.5 + self.flame_flicker/1.5),  # Top
-            (self.x - self.base_size/4, self.y),  # Bottom left
-            (self.x + self.base_size/4, self.y)   # Bottom right
-        ]
+        inner_flame_points = (
+            (self.flame_x, int(self.y - (self.flame_height + tip_offset)/1.5)),  # Top
+            self.inner_flame_bl,
+            self.inner_flame_br
+        )
         
         # Draw fire glow
-        for i in range(3):
-            glow_size = self.base_size + i * 10
-            glow_color = (255, 100, 0, 50 - i * 15)
-            glow_surf = pygame.Surface((glow_size*2, glow_size*2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
+        for glow_surf, glow_size in self.glow_surfaces:
             surface.blit(glow_surf, (self.x - glow_size, self.y - glow_size))
         
         pygame.draw.polygon(surface, RED, flame_points)
@@ -890,13 +927,13 @@ class Tree(pygame.sprite.Sprite):
         self.sway_offset = 0
         self.sway_direction = 1
         self.sway_speed = random.uniform(0.05, 0.1)
-        self.image = pygame.Surface((self.foliage_radius * 2 + 10, self.trunk_height + self.foliage_radius + 10), pygame.SRCALPHA)
+        self.image = pygame.Surface((self.foliage_radius * 2 + 10, self.trunk_height + self.foliage_radius + 10), pygame.SRCALPHA).convert_alpha()
         self.rect = self.image.get_rect(center=(x, y))
         self.alpha = 255
         self.target_alpha = 255
         
         # Add to layers
-        roof_layer.add(self)
+        world.add(self, layer=ROOF_LAYER)
         obstacles.add(self)
         
     def update(self):
@@ -978,7 +1015,7 @@ class Rock(pygame.sprite.Sprite):
         self.x = x
         self.y = y
         self.size = size if size else random.randint(10, 25)
-        self.image = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
+        self.image = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA).convert_alpha()
         self.rect = self.image.get_rect(center=(x, y))
         self.color = DARK_GREY
         self.shape_points = []
@@ -987,20 +1024,21 @@ class Rock(pygame.sprite.Sprite):
         self.generate_rock_shape()
         
         # Add to layers
-        object_layer.add(self)
+        world.add(self, layer=OBJECT_LAYER)
         obstacles.add(self)
     
     def generate_rock_shape(self):
         # Create an irregular polygon for a more natural rock
-        num_points = random.randint(6, 10)
+        uniform, cos, sin = _uniform, math.cos, math.sin
+        num_points = _randint(6, 10)
         self.shape_points = []
         
         for i in range(num_points):
             angle = math.radians((360 / num_points) * i)
             # Vary the radius to create irregular shape
-            radius_variation = random.uniform(0.8, 1.2)
-            x = self.x + math.cos(angle) * self.size * radius_variation
-            y = self.y + math.sin(angle) * self.size * radius_variation
+            radius = self.size * uniform(0.8, 1.2)
+            x = self.x + cos(angle) * radius
+            y = self.y + sin(angle) * radius
             self.shape_points.append((x, y))
         
     def draw(self, surface):
@@ -1042,38 +1080,41 @@ class Rock(pygame.sprite.Sprite):
                 )
 
 def create_cobblestone_background():
-    background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
     background.fill((50, 50, 50))  # Dark grey base
     
-    # Create detailed cobblestones
-    for x in range(0, WINDOW_WIDTH, 15):
-        for y in range(0, WINDOW_HEIGHT, 15):
-            offset_x = random.randint(-3, 3)
-            offset_y = random.randint(-3, 3)
-            size = random.randint(5, 8)
-            
-            # Create more natural looking stones with varied shades of grey
-            main_color = random.randint(100, 170)
-            variation = random.randint(-15, 15)
-            color = (main_color + variation, main_color + variation, main_color + variation)
-            
-            # Draw the cobblestone
-            pygame.draw.circle(background, color, (x + offset_x, y + offset_y), size)
-            
-            # Add a subtle highlight or shadow to give dimension
-            highlight = (min(255, main_color + 30), min(255, main_color + 30), min(255, main_color + 30))
-            shadow = (max(0, main_color - 30), max(0, main_color - 30), max(0, main_color - 30))
-            
-            # Small highlight on top-left
-            pygame.draw.circle(background, highlight, 
-                              (x + offset_x - size//3, y + offset_y - size//3), 
-                              size//3)
-            
-            # Small shadow on bottom-right
-            pygame.draw.circle(background, shadow, 
-                              (x + offset_x + size//3, y + offset_y + size//3), 
-                              size//3)
+    # Draw every random value up front in a few batched calls
+    tiles = [(x, y) for x in range(0, WINDOW_WIDTH, 15) for y in range(0, WINDOW_HEIGHT, 15)]
+    n = len(tiles)
+    offsets_x = _rng.choices(range(-3, 4), k=n)
+    offsets_y = _rng.choices(range(-3, 4), k=n)
+    sizes = _rng.choices(range(5, 9), k=n)
+    main_colors = _rng.choices(range(100, 171), k=n)
+    variations = _rng.choices(range(-15, 16), k=n)
     
+    # Create detailed cobblestones
+    for (x, y), offset_x, offset_y, size, main_color, variation in zip(
+            tiles, offsets_x, offsets_y, sizes, main_colors, variations):
+        # Create more natural looking stones with varied shades of grey
+        color = (main_color + variation, main_color + variation, main_color + variation)
+        
+        # Draw the cobblestone
+        pygame.draw.circle(background, color, (x + offset_x, y + offset_y), size)
+        
+        # Add a subtle highlight or shadow to give dimension
+        highlight = (min(255, main_color + 30), min(255, main_color + 30), min(255, main_color + 30))
+        shadow = (max(0, main_color - 30), max(0, main_color - 30), max(0, main_color - 30))
+        
+        # Small highlight on top-left
+        pygame.draw.circle(background, highlight, 
+                          (x + offset_x - size//3, y + offset_y - size//3), 
+                          size//3)
+        
+        # Small shadow on bottom-right
+        pygame.draw.circle(background, shadow, 
+                          (x + offset_x + size//3, y + offset_y + size//3), 
+                          size//3)
+        
     return background
 
 def spawn_environment():
@@ -1142,7 +1183,7 @@ def spawn_environment():
             log = pygame.sprite.Sprite()
             log.x = x
             log.y = y
-            log.image = pygame.Surface((random.randint(15, 30), random.randint(5, 10)), pygame.SRCALPHA)
+            log.image = pygame.Surface((random.randint(15, 30), random.randint(5, 10)), pygame.SRCALPHA).convert_alpha()
             log.rect = log.image.get_rect(center=(x, y))
             
             # Random rotation for log
@@ -1153,7 +1194,7 @@ def spawn_environment():
                            log.y - log.image.get_height()/2, 
                            log.image.get_width(), log.image.get_height()))
             
-            ground_layer.add(log)
+            world.add(log, layer=GROUND_LAYER)
 
 def spawn_enemy(player):
     # Determine spawn position outside screen
@@ -1215,45 +1256,58 @@ def draw_menu():
     score_text = font_medium.render(f"Highscore: {highscore}", True, WHITE)
     screen.blit(score_text, (WINDOW_WIDTH/2 - score_text.get_width()/2, 500))
 
-def draw_equipment_select():
-    screen.fill((30, 30, 30))
+def build_equipment_select_panel():
+    panel = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    panel.fill((30, 30, 30))
     
     # Title
     title = font_large.render("Select Equipment", True, WHITE)
-    screen.blit(title, (WINDOW_WIDTH/2 - title.get_width()/2, 50))
+    panel.blit(title, (WINDOW_WIDTH/2 - title.get_width()/2, 50))
     
     # Left hand
     left_title = font_medium.render("Left Hand", True, WHITE)
-    screen.blit(left_title, (WINDOW_WIDTH/4 - left_title.get_width()/2, 100))
+    panel.blit(left_title, (WINDOW_WIDTH/4 - left_title.get_width()/2, 100))
     
     # Right hand
     right_title = font_medium.render("Right Hand", True, WHITE)
-    screen.blit(right_title, (3*WINDOW_WIDTH/4 - right_title.get_width()/2, 100))
+    panel.blit(right_title, (3*WINDOW_WIDTH/4 - right_title.get_width()/2, 100))
     
     # Equipment options
-    for i, equipment in enumerate(EQUIPMENT_TYPES):
-        # Left side button
-        left_rect = pygame.Rect(WINDOW_WIDTH/4 - 100, 150 + i * 60, 200, 40)
-        pygame.draw.rect(screen, GREY, left_rect)
-        left_text = font_medium.render(equipment.capitalize(), True, BLACK)
-        screen.blit(left_text, (left_rect.centerx - left_text.get_width()/2, left_rect.centery - left_text.get_height()/2))
-        
-        # Right side button
-        right_rect = pygame.Rect(3*WINDOW_WIDTH/4 - 100, 150 + i * 60, 200, 40)
-        pygame.draw.rect(screen, GREY, right_rect)
-        right_text = font_medium.render(equipment.capitalize(), True, BLACK)
-        screen.blit(right_text, (right_rect.centerx - right_text.get_width()/2, right_rect.centery - right_text.get_height()/2))
+    for equipment, left_rect, right_rect in zip(EQUIPMENT_TYPES, LEFT_EQUIPMENT_RECTS, RIGHT_EQUIPMENT_RECTS):
+        label = font_medium.render(equipment.capitalize(), True, BLACK)
+        for rect in (left_rect, right_rect):
+            pygame.draw.rect(panel, GREY, rect)
+            panel.blit(label, (rect.centerx - label.get_width()/2, rect.centery - label.get_height()/2))
     
     # Instructions
     instructions = font_medium.render("Click to select equipment for each hand", True, WHITE)
-    screen.blit(instructions, (WINDOW_WIDTH/2 - instructions.get_width()/2, 400))
+    panel.blit(instructions, (WINDOW_WIDTH/2 - instructions.get_width()/2, 400))
+    
+    return panel
+
+def draw_equipment_select():
+    global equipment_select_panel, button_highlight
+    
+    # The panel is static, so render it once and reuse it
+    if equipment_select_panel is None:
+        equipment_select_panel = build_equipment_select_panel()
+        button_highlight = pygame.Surface(LEFT_EQUIPMENT_RECTS[0].size, pygame.SRCALPHA)
+        button_highlight.fill((255, 255, 255, 60))
+        button_highlight = button_highlight.convert_alpha()
+    
+    screen.blit(equipment_select_panel, (0, 0))
+    
+    # Highlight the hovered button only
+    mouse_pos = pygame.mouse.get_pos()
+    for rect in LEFT_EQUIPMENT_RECTS + RIGHT_EQUIPMENT_RECTS:
+        if rect.collidepoint(mouse_pos):
+            screen.blit(button_highlight, rect)
+            break
     
     return EQUIPMENT_TYPES
 
 def draw_game_over():
-    overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
-    screen.blit(overlay, (0, 0))
+    screen.blit(GAME_OVER_OVERLAY, (0, 0))
     
     # Game over message
     game_over = font_large.render("Game Over", True, RED)
@@ -1304,10 +1358,7 @@ def reset_game():
     global kills, game_time
     
     # Clear all sprites
-    ground_layer.empty()
-    splatter_layer.empty()
-    object_layer.empty()
-    roof_layer.empty()
+    world.empty()
     characters.empty()
     obstacles.empty()
     weapons.empty()
@@ -1345,14 +1396,12 @@ def main():
                 mouse_pos = pygame.mouse.get_pos()
                 
                 # Check left equipment buttons
-                for i, equipment in enumerate(EQUIPMENT_TYPES):
-                    left_rect = pygame.Rect(WINDOW_WIDTH/4 - 100, 150 + i * 60, 200, 40)
+                for equipment, left_rect in zip(EQUIPMENT_TYPES, LEFT_EQUIPMENT_RECTS):
                     if left_rect.collidepoint(mouse_pos):
                         left_equipment = equipment
                 
                 # Check right equipment buttons
-                for i, equipment in enumerate(EQUIPMENT_TYPES):
-                    right_rect = pygame.Rect(3*WINDOW_WIDTH/4 - 100, 150 + i * 60, 200, 40)
+                for equipment, right_rect in zip(EQUIPMENT_TYPES, RIGHT_EQUIPMENT_RECTS):
                     if right_rect.collidepoint(mouse_pos):
                         right_equipment = equipment
                 
@@ -1376,10 +1425,7 @@ def main():
             game_time += 1/FPS
             
             # Update sprites
-            ground_layer.update()
-            splatter_layer.update()
-            object_layer.update()
-            roof_layer.update()
+            world.update()
             
             # Spawn enemies
             spawn_timer -= 1/FPS
@@ -1407,19 +1453,7 @@ def main():
             screen.blit(background, (0, 0))
             
             # Draw all layers in order
-            for sprite in ground_layer:
-                sprite.draw(screen)
-                
-            for sprite in splatter_layer:
-                sprite.draw(screen)
-                
-            for sprite in object_layer:
-                sprite.draw(screen)
-                
-            for sprite in effect_layer:
-                sprite.draw(screen)
-                
-            for sprite in roof_layer:
+            for sprite in world:
                 sprite.draw(screen)
             
             # Draw UI
@@ -1430,19 +1464,7 @@ def main():
             screen.blit(background, (0, 0))
             
             # Draw all layers in order
-            for sprite in ground_layer:
-                sprite.draw(screen)
-                
-            for sprite in splatter_layer:
-                sprite.draw(screen)
-                
-            for sprite in object_layer:
-                sprite.draw(screen)
-                
-            for sprite in effect_layer:
-                sprite.draw(screen)
-                
-            for sprite in roof_layer:
+            for sprite in world:
                 sprite.draw(screen)
             
             # Draw game over screen
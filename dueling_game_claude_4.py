@@ -12,6 +12,8 @@ pygame.init()
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
+SIM_DT = 1 / FPS  # Fixed simulation step; per-frame speeds below are per step
+MAX_SIM_STEPS = 5  # Drop backlog after a long stall instead of spiralling
 
 # Colors
 YELLOW = (255, 255, 0)
@@ -23,6 +25,8 @@ BROWN = (139, 69, 19)
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 BLOOD_RED = (139, 0, 0)
+TREE_FADE_ALPHA = 100  # Roof alpha for trees with a character underneath
+TREE_FADE_LEVELS = 8  # Pre-rendered alpha steps from opaque to fully faded, one per frame
 
 # Game settings
 CHARACTER_RADIUS = 20
@@ -33,6 +37,60 @@ MOVEMENT_SPEED = 2
 BODY_ROTATION_SPEED = 0.05
 ARM_ROTATION_SPEED = 0.08
 MAX_HP = 9
+# Arm swing limits relative to body facing (the left arm reaches further left)
+ARM_LIMIT_NEAR = math.pi / 4
+ARM_LIMIT_FAR = 3 * math.pi / 4
+# Squared distance thresholds, so range checks need no sqrt
+APPROACH_TRIGGER_SQ = 60 * 60
+ATTACK_RANGE_SQ = 35 * 35
+ATTACK_BREAK_SQ = 80 * 80
+RETREAT_DONE_SQ = 100 * 100
+CIRCLE_ARRIVE_SQ = 5 * 5
+CAMPFIRE_DAMAGE_SQ = 25 * 25
+
+TREE_GRID_CELL = 64  # Must be at least the tree size for 3x3 cell probing
+MAX_SPLATTERS = 512
+MAX_CACHED_TEXTS = 512
+BODY_ATLAS_SIZE = 256  # Pre-rendered body facings
+BODY_ATLAS_SCALE = BODY_ATLAS_SIZE / (2 * math.pi)
+SHIELD_SIZE = 15
+SHIELD_ATLAS_SIZE = 64  # Facings per quarter turn; the square repeats every pi/2
+SHIELD_ATLAS_SCALE = SHIELD_ATLAS_SIZE / (math.pi / 2)
+CIRCLE_STEP = 0.01  # Radians per frame enemies move around the player
+CIRCLE_STEP_COS = math.cos(CIRCLE_STEP)
+CIRCLE_STEP_SIN = math.sin(CIRCLE_STEP)
+
+# Wrap an angle difference into [-pi, pi)
+def wrap_pi(angle: float) -> float:
+    return (angle + math.pi) % math.tau - math.pi
+
+# Collision kernel on plain float lists: pushes overlapping circles apart
+# in place, splitting the overlap evenly between each pair
+def resolve_overlaps(xs: List[float], ys: List[float], radii: List[float]):
+    sqrt = math.sqrt
+    n = len(xs)
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = xs[j] - xs[i]
+            dy = ys[j] - ys[i]
+            min_distance = radii[i] + radii[j]
+            distance_sq = dx*dx + dy*dy
+            if distance_sq >= min_distance * min_distance:
+                continue
+                
+            # Apply separation along the normalized center line
+            distance = sqrt(distance_sq)
+            if distance > 0:
+                nx = dx / distance
+                ny = dy / distance
+            else:
+                nx, ny = 1.0, 0.0
+            push = (min_distance - distance) * 0.5
+            
+            xs[i] -= nx * push
+            ys[i] -= ny * push
+            xs[j] += nx * push
+            ys[j] += ny * push
 
 class GameState(Enum):
     MENU = 1
@@ -53,21 +111,65 @@ class AIState(Enum):
     RETREATING = 4
     TESTING_DISTANCE = 5
 
+# Arm extension speed per equipment, indexed by EquipmentType value
+EXTENSION_SPEEDS = (
+    0.8,  # NONE
+    0.3,  # SWORD
+    0.4,  # SHIELD
+    0.6,  # DAGGER
+)
+
+# Hit reach past the hand, indexed the same way; None means the item can't hit
+WEAPON_REACH = (
+    5,     # NONE
+    30,    # SWORD
+    None,  # SHIELD
+    20,    # DAGGER
+)
+
 class Equipment:
+    __slots__ = ('type', 'extension_speed')
+    
     def __init__(self, eq_type: EquipmentType):
         self.type = eq_type
-        self.extension_speed = self._get_extension_speed()
-        
-    def _get_extension_speed(self):
-        speeds = {
-            EquipmentType.NONE: 0.8,
-            EquipmentType.SWORD: 0.3,
-            EquipmentType.SHIELD: 0.4,
-            EquipmentType.DAGGER: 0.6
-        }
-        return speeds.get(self.type, 0.3)
+        self.extension_speed = EXTENSION_SPEEDS[eq_type.value]
+
+class BloodSplatters:
+    # Fixed-capacity ring buffer of splatters kept as parallel lists. Each
+    # splatter stores its spawn time, so aging needs no per-frame update and
+    # new splatters overwrite the oldest slot once the buffer is full.
+    __slots__ = ('capacity', 'xs', 'ys', 'spawn_times', 'max_times', 'count', 'head')
+    
+    def __init__(self, capacity: int = MAX_SPLATTERS):
+        self.capacity = capacity
+        self.xs = [0.0] * capacity
+        self.ys = [0.0] * capacity
+        self.spawn_times = [0.0] * capacity
+        self.max_times = [0.0] * capacity
+        self.count = 0  # Number of slots in use
+        self.head = 0  # Next slot to write
+        
+    def add(self, x: float, y: float, now: float, max_time: float):
+        i = self.head
+        self.xs[i] = x
+        self.ys[i] = y
+        self.spawn_times[i] = now
+        self.max_times[i] = max_time
+        self.head = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
 
 class Character:
+    # Fixed attribute layouts: characters are touched many times per frame
+    __slots__ = ('x', 'y', 'radius', 'angle', 'hp', 'max_hp',
+                 'left_arm_extended', 'right_arm_extended',
+                 'left_arm_length', 'right_arm_length',
+                 'left_arm_angle', 'right_arm_angle',
+                 'target_left_length', 'target_right_length',
+                 '_left_arm_trig', '_right_arm_trig',
+                 'left_equipment', 'right_equipment',
+                 'velocity', 'knockback_factor', 'damage_cooldown', 'last_damage_time')
+    
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -86,13 +188,16 @@ class Character:
         self.target_left_length = SHOULDER_SIZE
         self.target_right_length = SHOULDER_SIZE
         
+        # Cached (angle, cos, sin) per arm, refreshed only when the angle changes
+        self._left_arm_trig = (None, 0.0, 0.0)
+        self._right_arm_trig = (None, 0.0, 0.0)
+        
         # Equipment
         self.left_equipment = Equipment(EquipmentType.NONE)
         self.right_equipment = Equipment(EquipmentType.NONE)
         
         # Physics
-        self.velocity_x = 0
-        self.velocity_y = 0
+        self.velocity = pygame.math.Vector2(0, 0)
         self.knockback_factor = 0.8
         
         # Combat
@@ -101,55 +206,47 @@ class Character:
         
     def update(self, dt: float):
         # Update arm extensions
-        self._update_arm_extension(dt)
+        self._update_arm_extension()
         
-        # Apply velocity
-        self.x += self.velocity_x
-        self.y += self.velocity_y
-        
-        # Apply friction
-        self.velocity_x *= 0.9
-        self.velocity_y *= 0.9
+        # Apply velocity and friction (in-place Vector2 ops run in C)
+        velocity = self.velocity
+        self.x += velocity.x
+        self.y += velocity.y
+        velocity *= 0.9
         
         # Update damage cooldown
         if self.damage_cooldown > 0:
             self.damage_cooldown -= dt
             
-    def _update_arm_extension(self, dt: float):
-        # Left arm
+    def _update_arm_extension(self):
+        # Both arms share one update rule: grow toward the target while
+        # extended, shrink back to the shoulder otherwise
+        step = self.left_equipment.extension_speed
         if self.left_arm_extended:
-            if self.left_arm_length < self.target_left_length:
-                self.left_arm_length += self.left_equipment.extension_speed * dt * 60
-                self.left_arm_length = min(self.left_arm_length, self.target_left_length)
+            self.left_arm_length = min(self.left_arm_length + step, self.target_left_length)
         else:
-            if self.left_arm_length > SHOULDER_SIZE:
-                self.left_arm_length -= self.left_equipment.extension_speed * dt * 60
-                self.left_arm_length = max(self.left_arm_length, SHOULDER_SIZE)
+            self.left_arm_length = max(self.left_arm_length - step, SHOULDER_SIZE)
                 
-        # Right arm
+        step = self.right_equipment.extension_speed
         if self.right_arm_extended:
-            if self.right_arm_length < self.target_right_length:
-                self.right_arm_length += self.right_equipment.extension_speed * dt * 60
-                self.right_arm_length = min(self.right_arm_length, self.target_right_length)
+            self.right_arm_length = min(self.right_arm_length + step, self.target_right_length)
         else:
-            if self.right_arm_length > SHOULDER_SIZE:
-                self.right_arm_length -= self.right_equipment.extension_speed * dt * 60
-                self.right_arm_length = max(self.right_arm_length, SHOULDER_SIZE)
+            self.right_arm_length = max(self.right_arm_length - step, SHOULDER_SIZE)
     
     def extend_arm(self, left: bool, target_angle: float):
         if left:
             self.left_arm_extended = True
             self.target_left_length = MAX_ARM_LENGTH
             # Set initial angle toward target within limits
-            relative_angle = target_angle - self.angle
-            relative_angle = max(-math.pi/4, min(relative_angle, 3*math.pi/4))
+            relative_angle = wrap_pi(target_angle - self.angle)
+            relative_angle = max(-ARM_LIMIT_NEAR, min(relative_angle, ARM_LIMIT_FAR))
             self.left_arm_angle = self.angle + relative_angle
         else:
             self.right_arm_extended = True
             self.target_right_length = MAX_ARM_LENGTH
             # Set initial angle toward target within limits
-            relative_angle = target_angle - self.angle
-            relative_angle = max(-3*math.pi/4, min(relative_angle, math.pi/4))
+            relative_angle = wrap_pi(target_angle - self.angle)
+            relative_angle = max(-ARM_LIMIT_FAR, min(relative_angle, ARM_LIMIT_NEAR))
             self.right_arm_angle = self.angle + relative_angle
     
     def retract_arm(self, left: bool):
@@ -163,76 +260,78 @@ class Character:
     def update_arm_angle(self, left: bool, target_angle: float, dt: float):
         if left and self.left_arm_extended:
             # Apply rotation limits
-            relative_angle = target_angle - self.angle
-            relative_angle = max(-math.pi/4, min(relative_angle, 3*math.pi/4))
+            relative_angle = wrap_pi(target_angle - self.angle)
+            relative_angle = max(-ARM_LIMIT_NEAR, min(relative_angle, ARM_LIMIT_FAR))
             target = self.angle + relative_angle
             
-            angle_diff = target - self.left_arm_angle
-            if abs(angle_diff) > math.pi:
-                angle_diff = angle_diff - 2*math.pi if angle_diff > 0 else angle_diff + 2*math.pi
+            angle_diff = wrap_pi(target - self.left_arm_angle)
             
             self.left_arm_angle += max(-ARM_ROTATION_SPEED, min(ARM_ROTATION_SPEED, angle_diff))
             
         elif not left and self.right_arm_extended:
             # Apply rotation limits
-            relative_angle = target_angle - self.angle
-            relative_angle = max(-3*math.pi/4, min(relative_angle, math.pi/4))
+            relative_angle = wrap_pi(target_angle - self.angle)
+            relative_angle = max(-ARM_LIMIT_FAR, min(relative_angle, ARM_LIMIT_NEAR))
             target = self.angle + relative_angle
             
-            angle_diff = target - self.right_arm_angle
-            if abs(angle_diff) > math.pi:
-                angle_diff = angle_diff - 2*math.pi if angle_diff > 0 else angle_diff + 2*math.pi
+            angle_diff = wrap_pi(target - self.right_arm_angle)
             
             self.right_arm_angle += max(-ARM_ROTATION_SPEED, min(ARM_ROTATION_SPEED, angle_diff))
     
-    def get_hand_position(self, left: bool) -> Tuple[float, float]:
-        if left:
-            hand_x = self.x + math.cos(self.left_arm_angle) * self.left_arm_length
-            hand_y = self.y + math.sin(self.left_arm_angle) * self.left_arm_length
-        else:
-            hand_x = self.x + math.cos(self.right_arm_angle) * self.right_arm_length
-            hand_y = self.y + math.sin(self.right_arm_angle) * self.right_arm_length
-        return hand_x, hand_y
+    # Per-side variants for the per-frame paths, which always know the side
+    def left_arm_direction(self) -> Tuple[float, float]:
+        trig = self._left_arm_trig
+        if trig[0] != self.left_arm_angle:
+            angle = self.left_arm_angle
+            trig = self._left_arm_trig = (angle, math.cos(angle), math.sin(angle))
+        return trig[1], trig[2]
+    
+    def right_arm_direction(self) -> Tuple[float, float]:
+        trig = self._right_arm_trig
+        if trig[0] != self.right_arm_angle:
+            angle = self.right_arm_angle
+            trig = self._right_arm_trig = (angle, math.cos(angle), math.sin(angle))
+        return trig[1], trig[2]
     
-    def apply_knockback(self, angle: float, force: float):
-        self.velocity_x += math.cos(angle) * force
-        self.velocity_y += math.sin(angle) * force
+    def left_hand_position(self) -> Tuple[float, float]:
+        cos_a, sin_a = self.left_arm_direction()
+        return self.x + cos_a * self.left_arm_length, self.y + sin_a * self.left_arm_length
+    
+    def right_hand_position(self) -> Tuple[float, float]:
+        cos_a, sin_a = self.right_arm_direction()
+        return self.x + cos_a * self.right_arm_length, self.y + sin_a * self.right_arm_length
     
     def take_damage(self, amount: int, attacker_pos: Tuple[float, float]):
         if self.damage_cooldown <= 0:
             self.hp -= amount
             self.damage_cooldown = 0.5  # Damage immunity frames
             
-            # Apply knockback away from attacker
-            dx = self.x - attacker_pos[0]
-            dy = self.y - attacker_pos[1]
-            distance = math.sqrt(dx*dx + dy*dy)
-            if distance > 0:
-                knockback_angle = math.atan2(dy, dx)
-                self.apply_knockback(knockback_angle, 5.0)
+            # Apply knockback away from attacker (normalized offset, no trig)
+            offset = pygame.math.Vector2(self.x - attacker_pos[0], self.y - attacker_pos[1])
+            if offset.length_squared() > 0:
+                self.velocity += offset.normalize() * 5.0
     
     def get_collision_rect(self) -> pygame.Rect:
         return pygame.Rect(self.x - self.radius, self.y - self.radius, 
                           self.radius * 2, self.radius * 2)
 
 class Player(Character):
+    __slots__ = ('kills',)
+    
     def __init__(self, x: float, y: float):
         super().__init__(x, y)
         self.kills = 0
         
     def update(self, dt: float, mouse_pos: Tuple[int, int], mouse_buttons: Tuple[bool, bool, bool]):
         super().update(dt)
+        cursor_angle = math.atan2(mouse_pos[1] - self.y, mouse_pos[0] - self.x)
         
         # Face cursor when not attacking
         if not (mouse_buttons[0] or mouse_buttons[2]):
-            target_angle = math.atan2(mouse_pos[1] - self.y, mouse_pos[0] - self.x)
-            angle_diff = target_angle - self.angle
-            if abs(angle_diff) > math.pi:
-                angle_diff = angle_diff - 2*math.pi if angle_diff > 0 else angle_diff + 2*math.pi
+            angle_diff = wrap_pi(cursor_angle - self.angle)
             self.angle += max(-BODY_ROTATION_SPEED, min(BODY_ROTATION_SPEED, angle_diff))
         
         # Handle arm extensions
-        cursor_angle = math.atan2(mouse_pos[1] - self.y, mouse_pos[0] - self.x)
         
         if mouse_buttons[0]:  # Left click - right arm
             if not self.right_arm_extended:
@@ -249,11 +348,16 @@ class Player(Character):
             self.retract_arm(True)
 
 class Enemy(Character):
+    __slots__ = ('ai_state', 'state_timer', 'circle_cos', 'circle_sin',
+                 'circle_radius', 'attack_cooldown', 'retreat_timer')
+    
     def __init__(self, x: float, y: float):
         super().__init__(x, y)
         self.ai_state = AIState.CIRCLING
         self.state_timer = 0
-        self.circle_angle = random.uniform(0, 2*math.pi)
+        circle_angle = random.uniform(0, 2*math.pi) # Only seeds the orbit; it advances via circle_cos/circle_sin
+        self.circle_cos = math.cos(circle_angle)
+        self.circle_sin = math.sin(circle_angle)
         self.circle_radius = random.uniform(80, 120)
         self.attack_cooldown = 0
         self.retreat_timer = 0
@@ -277,7 +381,9 @@ class Enemy(Character):
     def update(self, dt: float, player: Player, obstacles: List[Any]):
         super().update(dt)
         
-        distance_to_player = math.sqrt((self.x - player.x)**2 + (self.y - player.y)**2)
+        dx = self.x - player.x
+        dy = self.y - player.y
+        distance_sq = dx*dx + dy*dy
         
         self.state_timer += dt
         self.attack_cooldown -= dt
@@ -285,13 +391,13 @@ class Enemy(Character):
         # State machine
         if self.ai_state == AIState.CIRCLING:
             self._circle_player(dt, player)
-            if distance_to_player < 60 and random.random() < 0.01:
+            if distance_sq < APPROACH_TRIGGER_SQ and random.random() < 0.01:
                 self.ai_state = AIState.APPROACHING
                 self.state_timer = 0
                 
         elif self.ai_state == AIState.APPROACHING:
             self._approach_player(dt, player)
-            if distance_to_player < 35:
+            if distance_sq < ATTACK_RANGE_SQ:
                 self.ai_state = AIState.ATTACKING
                 self.state_timer = 0
             elif self.state_timer > 3:
@@ -300,40 +406,44 @@ class Enemy(Character):
                 
         elif self.ai_state == AIState.ATTACKING:
             self._attack_player(dt, player)
-            if distance_to_player > 80 or self.state_timer > 2:
+            if distance_sq > ATTACK_BREAK_SQ or self.state_timer > 2:
                 self.ai_state = AIState.CIRCLING if random.random() < 0.7 else AIState.RETREATING
                 self.state_timer = 0
                 
         elif self.ai_state == AIState.RETREATING:
             self._retreat_from_player(dt, player)
-            if distance_to_player > 100 or self.state_timer > 1.5:
+            if distance_sq > RETREAT_DONE_SQ or self.state_timer > 1.5:
                 self.ai_state = AIState.CIRCLING
                 self.state_timer = 0
                 
         # Face player
         target_angle = math.atan2(player.y - self.y, player.x - self.x)
-        angle_diff = target_angle - self.angle
-        if abs(angle_diff) > math.pi:
-            angle_diff = angle_diff - 2*math.pi if angle_diff > 0 else angle_diff + 2*math.pi
+        angle_diff = wrap_pi(target_angle - self.angle)
         self.angle += max(-BODY_ROTATION_SPEED, min(BODY_ROTATION_SPEED, angle_diff))
         
     def _circle_player(self, dt: float, player: Player):
-        self.circle_angle += 0.01
-        target_x = player.x + math.cos(self.circle_angle) * self.circle_radius
-        target_y = player.y + math.sin(self.circle_angle) * self.circle_radius
+        sqrt = math.sqrt
+        # Advance around the circle by rotating the cached cos/sin pair
+        cos_a, sin_a = self.circle_cos, self.circle_sin
+        self.circle_cos = cos_a * CIRCLE_STEP_COS - sin_a * CIRCLE_STEP_SIN
+        self.circle_sin = sin_a * CIRCLE_STEP_COS + cos_a * CIRCLE_STEP_SIN
+        target_x = player.x + self.circle_cos * self.circle_radius
+        target_y = player.y + self.circle_sin * self.circle_radius
         
         dx = target_x - self.x
         dy = target_y - self.y
-        distance = math.sqrt(dx*dx + dy*dy)
+        distance_sq = dx*dx + dy*dy
         
-        if distance > 5:
+        if distance_sq > CIRCLE_ARRIVE_SQ:
+            distance = sqrt(distance_sq)
             self.x += (dx / distance) * MOVEMENT_SPEED * 0.7
             self.y += (dy / distance) * MOVEMENT_SPEED * 0.7
             
     def _approach_player(self, dt: float, player: Player):
+        sqrt = math.sqrt
         dx = player.x - self.x
         dy = player.y - self.y
-        distance = math.sqrt(dx*dx + dy*dy)
+        distance = sqrt(dx*dx + dy*dy)
         
         if distance > 0:
             self.x += (dx / distance) * MOVEMENT_SPEED * 0.8
@@ -358,9 +468,10 @@ class Enemy(Character):
                 self.retract_arm(False)
                 
     def _retreat_from_player(self, dt: float, player: Player):
+        sqrt = math.sqrt
         dx = self.x - player.x
         dy = self.y - player.y
-        distance = math.sqrt(dx*dx + dy*dy)
+        distance = sqrt(dx*dx + dy*dy)
         
         if distance > 0:
             self.x += (dx / distance) * MOVEMENT_SPEED
@@ -378,8 +489,24 @@ class Game:
         self.player = None
         self.enemies = []
         self.obstacles = []
-        self.blood_splatters = []
+        self.blood_splatters = BloodSplatters()
         self.campfire = None
+        self.circle_cache = {}
+        self.text_cache = {}
+        self.last_static_frame = None  # What the screen shows outside of play
+        
+        # Game over screen pieces that never change
+        self.game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.game_over_overlay.fill(BLACK)
+        self.game_over_overlay.set_alpha(128)
+        self.game_over_text = self.font.render("GAME OVER", True, RED)
+        self.continue_text = self.small_font.render("Press any key to return to menu", True, WHITE)
+        
+        # Enemy HP labels with their half extents, indexed by hp
+        self.hp_labels = []
+        for hp in range(MAX_HP + 1):
+            label = self.small_font.render(str(hp), True, RED)
+            self.hp_labels.append((label, label.get_width() // 2, label.get_height() // 2))
         
         # Equipment selection
         self.selected_left = EquipmentType.SWORD
@@ -388,8 +515,22 @@ class Game:
         # Game stats
         self.game_time = 0
         self.spawn_timer = 0
+        self.sim_accumulator = 0.0
         self.highscore = 0
         
+        # Per-state handlers, looked up once per frame instead of an if/elif chain
+        self._update_table = {
+            GameState.MENU: self._handle_menu,
+            GameState.EQUIPMENT_SELECT: self._handle_equipment_select,
+            GameState.PLAYING: self._step_game,
+        }
+        self._render_table = {
+            GameState.MENU: self._render_menu,
+            GameState.EQUIPMENT_SELECT: self._render_equipment_select,
+            GameState.PLAYING: self._render_game,
+            GameState.GAME_OVER: self._render_game_over,
+        }
+        
         self._generate_environment()
         
     def _generate_environment(self):
@@ -406,9 +547,112 @@ class Game:
             y = random.randint(50, SCREEN_HEIGHT - 50)
             self.obstacles.append({'x': x, 'y': y, 'size': 30, 'type': 'tree'})
             
+        # Trees as parallel lists for the per-frame roof pass, plus a spatial
+        # grid of tree indices used to find trees above characters
+        trees = [obstacle for obstacle in self.obstacles if obstacle['type'] == 'tree']
+        self.tree_xs = [obstacle['x'] for obstacle in trees]
+        self.tree_ys = [obstacle['y'] for obstacle in trees]
+        self.tree_sizes = [obstacle['size'] for obstacle in trees]
+        self.tree_grid = {}
+        for i, (x, y) in enumerate(zip(self.tree_xs, self.tree_ys)):
+            cell = (x // TREE_GRID_CELL, y // TREE_GRID_CELL)
+            self.tree_grid.setdefault(cell, []).append(i)
+            
+        # Trunk and foliage pre-composited into one sprite per tree size and
+        # fade level; stored with the offset from the trunk center to the
+        # sprite's top-left corner
+        self.tree_fade = [0] * len(self.tree_xs)  # Current fade level per tree
+        self.tree_sprites = {}
+        for size in set(self.tree_sizes):
+            half = max(size, 8)
+            top = size + 5  # Foliage sits 5px above the trunk center
+            sprite = pygame.Surface((half * 2, top + max(size - 5, 8)), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, BROWN, (half, top), 8)
+            pygame.draw.circle(sprite, GREEN, (half, top - 5), size)
+            sprite = sprite.convert_alpha()
+            levels = [sprite]
+            for level in range(1, TREE_FADE_LEVELS):
+                alpha = 255 - (255 - TREE_FADE_ALPHA) * level // (TREE_FADE_LEVELS - 1)
+                faded = sprite.copy()
+                faded.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+                levels.append(faded)
+            self.tree_sprites[size] = (levels, half, top)
+            
         # Place campfire
         self.campfire = {'x': SCREEN_WIDTH // 2, 'y': SCREEN_HEIGHT // 2, 'bob_offset': 0}
         
+        # Ground layer - cobblestone, rendered once and blitted every frame
+        # Draw one 40x40 tile per shade, then stamp them all in a single blits() call
+        self.ground_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.ground_surface.fill(BLACK)
+        tiles = {}
+        for shade in range(100, 141):
+            tile = pygame.Surface((40, 40)).convert()
+            tile.fill(BLACK)
+            pygame.draw.circle(tile, (shade, shade, shade), (20, 20), 15)
+            tiles[shade] = tile
+        self.ground_surface.blits([(tiles[random.randint(100, 140)], (x, y))
+                                   for x in range(0, SCREEN_WIDTH, 40)
+                                   for y in range(0, SCREEN_HEIGHT, 40)], False)
+        
+        # Rocks never move, so bake them into one object layer surface
+        self.static_objects_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        for obstacle in self.obstacles:
+            if obstacle['type'] == 'rock':
+                pygame.draw.circle(self.static_objects_surface, DARK_GREY, 
+                                 (int(obstacle['x']), int(obstacle['y'])), 
+                                 obstacle['size'])
+        self.static_objects_surface = self.static_objects_surface.convert_alpha()
+        
+        # Blood splatter sprites by radius (splatters shrink from 8 to 1)
+        self.splatter_sprites = {size: self._get_circle(size, BLOOD_RED) for size in range(1, 9)}
+        
+        # Character body sprites (body + direction indicator), one per
+        # quantized facing angle, shared by every character
+        self.body_sprites = []
+        half = self.body_sprite_half = CHARACTER_RADIUS + 6
+        for i in range(BODY_ATLAS_SIZE):
+            angle = i * 2 * math.pi / BODY_ATLAS_SIZE
+            sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, YELLOW, (half, half), CHARACTER_RADIUS)
+            end_x = half + math.cos(angle) * (CHARACTER_RADIUS + 5)
+            end_y = half + math.sin(angle) * (CHARACTER_RADIUS + 5)
+            pygame.draw.line(sprite, BLACK, (half, half), (end_x, end_y), 2)
+            self.body_sprites.append(sprite.convert_alpha())
+            
+        # Shield sprites, a square tangent to the arm, over one quarter turn
+        self.shield_sprites = []
+        half = SHIELD_SIZE + 1
+        for i in range(SHIELD_ATLAS_SIZE):
+            angle = i * (math.pi / 2) / SHIELD_ATLAS_SIZE
+            ux = math.cos(angle) * SHIELD_SIZE
+            uy = math.sin(angle) * SHIELD_SIZE
+            sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            pygame.draw.polygon(sprite, GREY, [(half - uy, half + ux), (half - ux, half - uy),
+                                               (half + uy, half - ux), (half + ux, half + uy)])
+            self.shield_sprites.append(sprite.convert_alpha())
+        
+    def _get_circle(self, radius, color):
+        # Filled circle sprites keyed by (radius, color), rasterized on first use
+        key = (radius, color)
+        sprite = self.circle_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            sprite = self.circle_cache[key] = sprite.convert_alpha()
+        return sprite
+        
+    def _get_text(self, font, text, color):
+        # Rendered text keyed by (font, string, color); HUD strings change
+        # rarely, so nearly every lookup hits. Flushed wholesale when full.
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= MAX_CACHED_TEXTS:
+                self.text_cache.clear()
+            surface = self.text_cache[key] = font.render(text, True, color)
+        return surface
+        
     def run(self):
         running = True
         while running:
@@ -420,28 +664,30 @@ class Game:
                 elif event.type == pygame.KEYDOWN:
                     if self.state == GameState.GAME_OVER:
                         self.state = GameState.MENU
+                elif event.type == pygame.WINDOWEXPOSED:
+                    self.last_static_frame = None  # Window contents were lost
                         
-            if self.state == GameState.MENU:
-                self._handle_menu(pygame.mouse.get_pressed(), pygame.mouse.get_pos())
-            elif self.state == GameState.EQUIPMENT_SELECT:
-                self._handle_equipment_select(pygame.mouse.get_pressed(), pygame.mouse.get_pos())
-            elif self.state == GameState.PLAYING:
-                self._update_game(dt)
-            elif self.state == GameState.GAME_OVER:
-                pass
+            # Snapshot input once per frame (after the event pump) and hand it down
+            mouse_buttons = pygame.mouse.get_pressed()
+            mouse_pos = pygame.mouse.get_pos()
+            keys = pygame.key.get_pressed()
+            
+            handler = self._update_table.get(self.state)
+            if handler is not None:
+                handler(dt, mouse_buttons, mouse_pos, keys)
                 
             self._render()
             
         pygame.quit()
         
-    def _handle_menu(self, mouse_buttons, mouse_pos):
+    def _handle_menu(self, dt, mouse_buttons, mouse_pos, keys):
         if mouse_buttons[0]:  # Left click
             # Check if clicked on play button area
             if SCREEN_WIDTH//2 - 100 < mouse_pos[0] < SCREEN_WIDTH//2 + 100 and \
                SCREEN_HEIGHT//2 < mouse_pos[1] < SCREEN_HEIGHT//2 + 50:
                 self.state = GameState.EQUIPMENT_SELECT
                 
-    def _handle_equipment_select(self, mouse_buttons, mouse_pos):
+    def _handle_equipment_select(self, dt, mouse_buttons, mouse_pos, keys):
         if mouse_buttons[0]:
             # Left hand equipment selection
             for i, eq_type in enumerate([EquipmentType.SWORD, EquipmentType.DAGGER, EquipmentType.NONE]):
@@ -468,16 +714,23 @@ class Game:
         self.player.left_equipment = Equipment(self.selected_left)
         self.player.right_equipment = Equipment(self.selected_right)
         self.enemies = []
-        self.blood_splatters = []
+        self.blood_splatters = BloodSplatters()
         self.game_time = 0
         self.spawn_timer = 0
-        
-    def _update_game(self, dt):
+        self.sim_accumulator = 0.0
+        
+    def _step_game(self, dt, mouse_buttons, mouse_pos, keys):
+        # Step the simulation at a fixed rate regardless of frame time
+        self.sim_accumulator = min(self.sim_accumulator + dt, SIM_DT * MAX_SIM_STEPS)
+        while self.sim_accumulator >= SIM_DT and self.state == GameState.PLAYING:
+            self._update_game(SIM_DT, mouse_buttons, mouse_pos, keys)
+            self.sim_accumulator -= SIM_DT
+            
+    def _update_game(self, dt, mouse_buttons, mouse_pos, keys):
         self.game_time += dt
         self.spawn_timer += dt
         
         # Update player
-        keys = pygame.key.get_pressed()
         if keys[pygame.K_w]:
             self.player.y -= MOVEMENT_SPEED
         if keys[pygame.K_s]:
@@ -491,20 +744,20 @@ class Game:
         self.player.x = max(self.player.radius, min(SCREEN_WIDTH - self.player.radius, self.player.x))
         self.player.y = max(self.player.radius, min(SCREEN_HEIGHT - self.player.radius, self.player.y))
         
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_buttons = pygame.mouse.get_pressed()
         self.player.update(dt, mouse_pos, mouse_buttons)
         
-        # Update enemies
-        for enemy in self.enemies[:]:
+        # Update enemies; walk backwards so dead ones can be swapped with the
+        # last enemy and popped in O(1) (order doesn't matter)
+        enemies = self.enemies
+        for i in range(len(enemies) - 1, -1, -1):
+            enemy = enemies[i]
             enemy.update(dt, self.player, self.obstacles)
             if enemy.hp <= 0:
-                self.enemies.remove(enemy)
+                enemies[i] = enemies[-1]
+                enemies.pop()
                 self.player.kills += 1
                 # Add blood splatter
-                self.blood_splatters.append({
-                    'x': enemy.x, 'y': enemy.y, 'time': 0, 'max_time': 10
-                })
+                self.blood_splatters.add(enemy.x, enemy.y, self.game_time, 10)
                 
         # Spawn enemies
         spawn_rate = max(0.5, 3 - self.game_time * 0.1)
@@ -519,17 +772,11 @@ class Game:
         self.campfire['bob_offset'] = math.sin(self.game_time * 3) * 5
         
         # Check campfire damage
-        campfire_dist = math.sqrt((self.player.x - self.campfire['x'])**2 + 
-                                 (self.player.y - self.campfire['y'])**2)
-        if campfire_dist < 25:
+        dx = self.player.x - self.campfire['x']
+        dy = self.player.y - self.campfire['y']
+        if dx*dx + dy*dy < CAMPFIRE_DAMAGE_SQ:
             self.player.take_damage(1, (self.campfire['x'], self.campfire['y']))
             
-        # Update blood splatters
-        for splatter in self.blood_splatters[:]:
-            splatter['time'] += dt
-            if splatter['time'] > splatter['max_time']:
-                self.blood_splatters.remove(splatter)
-                
         # Check game over
         if self.player.hp <= 0:
             self.highscore = max(self.highscore, self.player.kills)
@@ -558,63 +805,65 @@ class Game:
         # Character vs character collisions
         all_chars = [self.player] + self.enemies
         
-        for i, char1 in enumerate(all_chars):
-            for char2 in all_chars[i+1:]:
-                distance = math.sqrt((char1.x - char2.x)**2 + (char1.y - char2.y)**2)
-                if distance < char1.radius + char2.radius:
-                    # Apply separation
-                    angle = math.atan2(char2.y - char1.y, char2.x - char1.x)
-                    overlap = (char1.radius + char2.radius) - distance
-                    
-                    char1.x -= math.cos(angle) * overlap * 0.5
-                    char1.y -= math.sin(angle) * overlap * 0.5
-                    char2.x += math.cos(angle) * overlap * 0.5
-                    char2.y += math.sin(angle) * overlap * 0.5
+        xs = [char.x for char in all_chars]
+        ys = [char.y for char in all_chars]
+        radii = [char.radius for char in all_chars]
+        resolve_overlaps(xs, ys, radii)
+        for char, x, y in zip(all_chars, xs, ys):
+            char.x = x
+            char.y = y
                     
-        # Weapon vs character collisions
+        # Weapon vs character collisions; hand positions are computed once
+        # per attacker rather than once per attacker/target pair
         for char in all_chars:
+            left_hand = char.left_hand_position()
+            right_hand = char.right_hand_position()
             for other in all_chars:
-                if char == other:
+                if char is other:
                     continue
                     
                 # Check weapon collisions
-                self._check_weapon_collision(char, other, True)  # Left hand
-                self._check_weapon_collision(char, other, False)  # Right hand
+                self._check_weapon_collision(char, other, True, left_hand)  # Left hand
+                self._check_weapon_collision(char, other, False, right_hand)  # Right hand
                 
-    def _check_weapon_collision(self, attacker, target, left_hand):
+    def _check_weapon_collision(self, attacker, target, left_hand, hand_pos):
         equipment = attacker.left_equipment if left_hand else attacker.right_equipment
         arm_extended = attacker.left_arm_extended if left_hand else attacker.right_arm_extended
         
-        if not arm_extended or equipment.type not in [EquipmentType.SWORD, EquipmentType.DAGGER, EquipmentType.NONE]:
+        if not arm_extended:
+            return
+        weapon_reach = WEAPON_REACH[equipment.type.value]
+        if weapon_reach is None:
             return
             
-        hand_x, hand_y = attacker.get_hand_position(left_hand)
-        distance = math.sqrt((hand_x - target.x)**2 + (hand_y - target.y)**2)
+        dx = hand_pos[0] - target.x
+        dy = hand_pos[1] - target.y
         
-        weapon_reach = 30 if equipment.type == EquipmentType.SWORD else 20 if equipment.type == EquipmentType.DAGGER else 5
+        hit_distance = target.radius + weapon_reach
         
-        if distance < target.radius + weapon_reach:
+        if dx*dx + dy*dy < hit_distance * hit_distance:
             damage = 1
             target.take_damage(damage, (attacker.x, attacker.y))
             
             # Add blood splatter
-            self.blood_splatters.append({
-                'x': target.x + random.uniform(-10, 10),
-                'y': target.y + random.uniform(-10, 10),
-                'time': 0, 'max_time': 5
-            })
+            self.blood_splatters.add(target.x + random.uniform(-10, 10),
+                                     target.y + random.uniform(-10, 10),
+                                     self.game_time, 5)
     
     def _render(self):
+        # Screens outside of play only change with the state or the equipment
+        # selection, so skip the repaint and flip while those hold still
+        if self.state != GameState.PLAYING:
+            frame_key = (self.state, self.selected_left, self.selected_right)
+            if frame_key == self.last_static_frame:
+                return
+            self.last_static_frame = frame_key
+        else:
+            self.last_static_frame = None
+            
         self.screen.fill(BLACK)
         
-        if self.state == GameState.MENU:
-            self._render_menu()
-        elif self.state == GameState.EQUIPMENT_SELECT:
-            self._render_equipment_select()
-        elif self.state == GameState.PLAYING:
-            self._render_game()
-        elif self.state == GameState.GAME_OVER:
-            self._render_game_over()
+        self._render_table[self.state]()
             
         pygame.display.flip()
         
@@ -687,19 +936,19 @@ class Game:
         
     def _render_game(self):
         # Ground layer - cobblestone
-        for x in range(0, SCREEN_WIDTH, 40):
-            for y in range(0, SCREEN_HEIGHT, 40):
-                shade = random.randint(100, 140)
-                color = (shade, shade, shade)
-                pygame.draw.circle(self.screen, color, (x + 20, y + 20), 15)
-        
-        # Splatter layer - blood
-        for splatter in self.blood_splatters:
-            alpha = max(0, 255 - int(splatter['time'] * 50))
-            color = (*BLOOD_RED, alpha)
-            size = max(1, 8 - int(splatter['time']))
-            pygame.draw.circle(self.screen, BLOOD_RED, 
-                             (int(splatter['x']), int(splatter['y'])), size)
+        self.screen.blit(self.ground_surface, (0, 0))
+        
+        # Splatter layer - blood; expired slots are simply skipped
+        splatters = self.blood_splatters
+        splatter_sprites = self.splatter_sprites
+        blood = []
+        for i in range(splatters.count):
+            age = self.game_time - splatters.spawn_times[i]
+            if age <= splatters.max_times[i]:
+                size = max(1, 8 - int(age))
+                blood.append((splatter_sprites[size],
+                              (int(splatters.xs[i]) - size, int(splatters.ys[i]) - size)))
+        self.screen.blits(blood, False)
         
         # Campfire
         campfire_x = int(self.campfire['x'])
@@ -727,112 +976,101 @@ class Game:
         
         # Object layer
         # Rocks
-        for obstacle in self.obstacles:
-            if obstacle['type'] == 'rock':
-                pygame.draw.circle(self.screen, DARK_GREY, 
-                                 (int(obstacle['x']), int(obstacle['y'])), 
-                                 obstacle['size'])
+        self.screen.blit(self.static_objects_surface, (0, 0))
         
-        # Characters
+        # Characters: every body in one blits() call, then arms and labels on top
         all_chars = [self.player] + self.enemies
+        body_sprites = self.body_sprites
+        half = self.body_sprite_half
+        self.screen.blits([(body_sprites[round(char.angle * BODY_ATLAS_SCALE) % BODY_ATLAS_SIZE],
+                            (int(char.x) - half, int(char.y) - half)) for char in all_chars], False)
         for char in all_chars:
             self._render_character(char)
-        
-        # Roof layer - trees with transparency
-        for obstacle in self.obstacles:
-            if obstacle['type'] == 'tree':
-                # Check if any character is under this tree
-                transparency = 255
-                for char in all_chars:
-                    distance = math.sqrt((char.x - obstacle['x'])**2 + (char.y - obstacle['y'])**2)
-                    if distance < obstacle['size']:
-                        transparency = 100
-                        break
-                
-                # Tree trunk
-                trunk_color = (*BROWN, min(255, transparency))
-                pygame.draw.circle(self.screen, BROWN, 
-                                 (int(obstacle['x']), int(obstacle['y'])), 8)
-                
-                # Foliage
-                foliage_color = (*GREEN, min(255, transparency))
-                pygame.draw.circle(self.screen, GREEN, 
-                                 (int(obstacle['x']), int(obstacle['y']) - 5), 
-                                 obstacle['size'])
+            
+        # Enemy HP labels, pre-rendered per value, also in one blits() call
+        hp_labels = self.hp_labels
+        labels = []
+        for enemy in self.enemies:
+            label, half_w, half_h = hp_labels[max(enemy.hp, 0)]
+            labels.append((label, (enemy.x - half_w, enemy.y - half_h)))
+        self.screen.blits(labels, False)
+        
+        # Find trees with a character under them by probing the grid cells
+        # around each character
+        tree_xs, tree_ys, tree_sizes = self.tree_xs, self.tree_ys, self.tree_sizes
+        covered_trees = set()
+        for char in all_chars:
+            cell_x = int(char.x) // TREE_GRID_CELL
+            cell_y = int(char.y) // TREE_GRID_CELL
+            for gx in (cell_x - 1, cell_x, cell_x + 1):
+                for gy in (cell_y - 1, cell_y, cell_y + 1):
+                    for i in self.tree_grid.get((gx, gy), ()):
+                        dx = char.x - tree_xs[i]
+                        dy = char.y - tree_ys[i]
+                        if dx*dx + dy*dy < tree_sizes[i] * tree_sizes[i]:
+                            covered_trees.add(i)
+        
+        # Roof layer - trees, fading a step per frame toward transparent while
+        # a character is underneath and back otherwise, blitted in one call
+        tree_sprites = self.tree_sprites
+        tree_fade = self.tree_fade
+        roof = []
+        for i in range(len(tree_xs)):
+            if i in covered_trees:
+                level = tree_fade[i] = min(tree_fade[i] + 1, TREE_FADE_LEVELS - 1)
+            else:
+                level = tree_fade[i] = max(tree_fade[i] - 1, 0)
+            levels, half, top = tree_sprites[tree_sizes[i]]
+            roof.append((levels[level], (int(tree_xs[i]) - half, int(tree_ys[i]) - top)))
+        self.screen.blits(roof, False)
         
         # UI
         self._render_ui()
     
     def _render_character(self, char):
-        # Main body circle
-        pygame.draw.circle(self.screen, YELLOW, (int(char.x), int(char.y)), char.radius)
-        
-        # Direction indicator (small line)
-        end_x = char.x + math.cos(char.angle) * (char.radius + 5)
-        end_y = char.y + math.sin(char.angle) * (char.radius + 5)
-        pygame.draw.line(self.screen, BLACK, (char.x, char.y), (end_x, end_y), 2)
-        
-        # Arms/shoulders
-        self._render_arm(char, True)  # Left arm
-        self._render_arm(char, False)  # Right arm
-        
-        # Health display for enemies
-        if isinstance(char, Enemy):
-            health_text = self.small_font.render(str(char.hp), True, RED)
-            self.screen.blit(health_text, (char.x - health_text.get_width()//2, 
-                                         char.y - health_text.get_height()//2))
-    
-    def _render_arm(self, char, left):
-        if left:
-            arm_angle = char.left_arm_angle
-            arm_length = char.left_arm_length
-            equipment = char.left_equipment
-        else:
-            arm_angle = char.right_arm_angle
-            arm_length = char.right_arm_length
-            equipment = char.right_equipment
-        
-        # Arm rectangle
-        arm_end_x = char.x + math.cos(arm_angle) * arm_length
-        arm_end_y = char.y + math.sin(arm_angle) * arm_length
-        
-        # Draw arm as thick line
-        pygame.draw.line(self.screen, YELLOW, (char.x, char.y), 
-                        (arm_end_x, arm_end_y), ARM_WIDTH)
-        
-        # Hand position
-        hand_x, hand_y = char.get_hand_position(left)
+        # Arms/shoulders over the body drawn in the batched body pass. Each arm
+        # keeps its own line call: a thick two-segment polyline would draw the
+        # shared body-center joint differently
+        left_cos, left_sin = char.left_arm_direction()
+        right_cos, right_sin = char.right_arm_direction()
+        center = (char.x, char.y)
+        left_hand = (char.x + left_cos * char.left_arm_length,
+                     char.y + left_sin * char.left_arm_length)
+        right_hand = (char.x + right_cos * char.right_arm_length,
+                      char.y + right_sin * char.right_arm_length)
+        pygame.draw.line(self.screen, YELLOW, center, left_hand, ARM_WIDTH)
+        pygame.draw.line(self.screen, YELLOW, center, right_hand, ARM_WIDTH)
+        
+        self._render_equipment(char.left_equipment, left_hand, char.left_arm_angle,
+                               left_cos, left_sin)
+        self._render_equipment(char.right_equipment, right_hand, char.right_arm_angle,
+                               right_cos, right_sin)
+        
+    def _render_equipment(self, equipment, hand_pos, angle, cos_a, sin_a):
+        hand_x, hand_y = hand_pos
         
         # Equipment rendering
         if equipment.type == EquipmentType.SWORD:
             # Sword extends from hand
             sword_length = 25
-            sword_end_x = hand_x + math.cos(arm_angle) * sword_length
-            sword_end_y = hand_y + math.sin(arm_angle) * sword_length
+            sword_end_x = hand_x + cos_a * sword_length
+            sword_end_y = hand_y + sin_a * sword_length
             pygame.draw.line(self.screen, GREY, (hand_x, hand_y), 
                            (sword_end_x, sword_end_y), 4)
             
         elif equipment.type == EquipmentType.DAGGER:
             # Shorter dagger
             dagger_length = 15
-            dagger_end_x = hand_x + math.cos(arm_angle) * dagger_length
-            dagger_end_y = hand_y + math.sin(arm_angle) * dagger_length
+            dagger_end_x = hand_x + cos_a * dagger_length
+            dagger_end_y = hand_y + sin_a * dagger_length
             pygame.draw.line(self.screen, GREY, (hand_x, hand_y), 
                            (dagger_end_x, dagger_end_y), 3)
             
         elif equipment.type == EquipmentType.SHIELD:
-            # Shield tangent to body
-            shield_angle = math.atan2(hand_y - char.y, hand_x - char.x) + math.pi/2
-            shield_size = 15
-            
-            shield_points = []
-            for i in range(4):
-                angle = shield_angle + (i * math.pi/2)
-                px = hand_x + math.cos(angle) * shield_size
-                py = hand_y + math.sin(angle) * shield_size
-                shield_points.append((px, py))
-            
-            pygame.draw.polygon(self.screen, GREY, shield_points)
+            # Shield tangent to body, from the quarter-turn atlas
+            sprite = self.shield_sprites[round(angle * SHIELD_ATLAS_SCALE) % SHIELD_ATLAS_SIZE]
+            half = sprite.get_width() // 2
+            self.screen.blit(sprite, (int(hand_x) - half, int(hand_y) - half))
     
     def _render_ui(self):
         # Player health bar
@@ -850,43 +1088,32 @@ class Game:
         color = GREEN if health_ratio > 0.5 else YELLOW if health_ratio > 0.25 else RED
         pygame.draw.rect(self.screen, color, (bar_x, bar_y, health_width, bar_height))
         
-        # Health text
-        health_text = self.small_font.render(f"HP: {self.player.hp}/{self.player.max_hp}", 
-                                           True, WHITE)
-        self.screen.blit(health_text, (bar_x, bar_y - 25))
-        
-        # Kills counter
-        kills_text = self.small_font.render(f"Kills: {self.player.kills}", True, WHITE)
-        self.screen.blit(kills_text, (SCREEN_WIDTH - kills_text.get_width() - 20, 20))
-        
-        # Game time
-        time_text = self.small_font.render(f"Time: {int(self.game_time)}s", True, WHITE)
-        self.screen.blit(time_text, (SCREEN_WIDTH - time_text.get_width() - 20, 50))
+        # Health text, kills counter and game time, blitted together
+        health_text = self._get_text(self.small_font, f"HP: {self.player.hp}/{self.player.max_hp}", 
+                                     WHITE)
+        kills_text = self._get_text(self.small_font, f"Kills: {self.player.kills}", WHITE)
+        time_text = self._get_text(self.small_font, f"Time: {int(self.game_time)}s", WHITE)
+        self.screen.blits((
+            (health_text, (bar_x, bar_y - 25)),
+            (kills_text, (SCREEN_WIDTH - kills_text.get_width() - 20, 20)),
+            (time_text, (SCREEN_WIDTH - time_text.get_width() - 20, 50)),
+        ), False)
     
     def _render_game_over(self):
         # Darken screen
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Game over text
-        game_over_text = self.font.render("GAME OVER", True, RED)
-        self.screen.blit(game_over_text, (SCREEN_WIDTH//2 - game_over_text.get_width()//2, 200))
-        
-        # Final stats
-        kills_text = self.font.render(f"Final Kills: {self.player.kills}", True, WHITE)
-        self.screen.blit(kills_text, (SCREEN_WIDTH//2 - kills_text.get_width()//2, 300))
-        
-        survival_text = self.font.render(f"Survival Time: {int(self.game_time)}s", True, WHITE)
-        self.screen.blit(survival_text, (SCREEN_WIDTH//2 - survival_text.get_width()//2, 350))
-        
-        highscore_text = self.font.render(f"High Score: {self.highscore}", True, YELLOW)
-        self.screen.blit(highscore_text, (SCREEN_WIDTH//2 - highscore_text.get_width()//2, 400))
-        
-        # Continue instruction
-        continue_text = self.small_font.render("Press any key to return to menu", True, WHITE)
-        self.screen.blit(continue_text, (SCREEN_WIDTH//2 - continue_text.get_width()//2, 500))
+        self.screen.blit(self.game_over_overlay, (0, 0))
+        
+        # Game over text, final stats and continue instruction, centered
+        # on their rows and blitted together
+        lines = (
+            (self.game_over_text, 200),
+            (self._get_text(self.font, f"Final Kills: {self.player.kills}", WHITE), 300),
+            (self._get_text(self.font, f"Survival Time: {int(self.game_time)}s", WHITE), 350),
+            (self._get_text(self.font, f"High Score: {self.highscore}", YELLOW), 400),
+            (self.continue_text, 500),
+        )
+        self.screen.blits([(text, (SCREEN_WIDTH//2 - text.get_width()//2, y)) for text, y in lines],
+                          False)
 
 if __name__ == "__main__":
     game = Game()
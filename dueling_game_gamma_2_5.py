@@ -1,5 +1,9 @@
 import pygame
+import bisect
+import functools
+import itertools
 import math
+import os
 import random
 from enum import Enum
 
@@ -21,6 +25,8 @@ DARK_GREY = (64, 64, 64)
 LIGHT_GREY = (192, 192, 192)
 BROWN = (139, 69, 19)
 BLOOD_COLOR = (139, 0, 0)
+STATIC_LAYER_KEY = (255, 0, 255) # Colorkey for the baked obstacle layer, never used by game art
+GROUND_MARGIN = 225 # Cobblestones reach 200px past the screen edge, plus their max radius
 
 # Game Settings
 PLAYER_SPEED = 150 # pixels per second
@@ -35,6 +41,7 @@ DEFAULT_ARM_RETRACT_SPEED = 400
 ARM_ROT_SPEED = 540 # degrees per second
 KNOCKBACK_SELF_COLLIDE = 50
 KNOCKBACK_DAMAGE = 200
+KNOCKBACK_DECAY_RATE = -math.log(0.85) * FPS # Per second; same as x0.85 per frame at FPS
 MAX_HP = 9
 
 # Equipment Specs
@@ -56,21 +63,50 @@ MIN_SPAWN_INTERVAL = 3.0
 SPAWN_TIME_FACTOR = 0.1 # Reduces interval by this much per second elapsed
 SPAWN_COUNT_FACTOR = 1.5 # Reduces interval by this much per missing enemy (vs max)
 MAX_ACTIVE_ENEMIES = 3
+ENEMY_AVOID_RADIUS = 80 # How close enemies check for hazard avoidance (added to the hazard's half size)
+
+# Collision broad phase: 256px cells (1 << 8), about 2x a fully extended sword reach
+ENTITY_CELL_SHIFT = 8
+BROADPHASE_MIN_ENTITIES = 32 # Up to this many entities, brute-force pairs beat building the grid
 
 # --- Utility Functions ---
 def normalize_vector(vector):
-    if vector.length() == 0:
+    try:
+        return vector.normalize() # One length computation; raises only for a zero vector
+    except ValueError:
         return pygame.Vector2(0, 0)
-    return vector.normalize()
+
+# Trig lookup tables at half-degree resolution (720 entries per turn)
+TRIG_LUT_SIZE = 720
+_COS_LUT = [math.cos(math.radians(i / 2)) for i in range(TRIG_LUT_SIZE)]
+_SIN_LUT = [math.sin(math.radians(i / 2)) for i in range(TRIG_LUT_SIZE)]
+
+def cos_sin_deg(angle_deg):
+    """(cos, sin) of an angle in degrees, rounded to the nearest half degree via lookup."""
+    index = round(angle_deg * 2) % TRIG_LUT_SIZE # round(), not int(): int() truncates negative angles toward zero
+    return _COS_LUT[index], _SIN_LUT[index]
+
+def heading_deg(dx, dy):
+    """Angle of (dx, dy) in degrees, same as Vector2(dx, dy).angle_to(Vector2(1, 0))."""
+    return -math.degrees(math.atan2(dy, dx))
+
+@functools.lru_cache(maxsize=8)
+def knockback_decay_factor(dt):
+    """exp(-rate * dt); every character shares dt, so this runs once per frame."""
+    return math.exp(-KNOCKBACK_DECAY_RATE * dt)
+
+def weighted_choice(options, cum_weights):
+    """Same draw as random.choices(options, cum_weights=cum_weights)[0], minus its per-call setup."""
+    return options[bisect.bisect(cum_weights, random.random() * cum_weights[-1])]
 
 def angle_lerp(current_angle, target_angle, factor, dt):
     """Linearly interpolates between two angles, handling wraparound."""
     diff = (target_angle - current_angle + 180) % 360 - 180
-    step = diff * factor * dt * 50 # Adjusted factor for smoother lerp with dt
-    # Prevent overshooting for small steps
-    if abs(step) > abs(diff):
+    t = factor * dt * 50 # Adjusted factor for smoother lerp with dt
+    # Prevent overshooting: |diff * t| > |diff| exactly when t > 1 (and diff != 0)
+    if t > 1 and diff:
        return target_angle
-    return (current_angle + step + 360) % 360
+    return (current_angle + diff * t + 360) % 360
 
 def rotate_point(point, angle, pivot):
     """Rotates a point around a pivot."""
@@ -78,9 +114,18 @@ def rotate_point(point, angle, pivot):
     rotated = translated.rotate(-angle) # Pygame rotation is counter-clockwise
     return rotated + pivot
 
+_FONT_CACHE = {} # size -> Font, loading a font is far costlier than rendering with it
+
+@functools.lru_cache(maxsize=64)
+def _render_text(text, size, color):
+    """Renders text once per (text, size, color); HUD strings repeat every frame until their value changes."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font.render(text, True, color)
+
 def draw_text(surface, text, size, x, y, color=WHITE, center=False):
-    font = pygame.font.Font(None, size)
-    text_surface = font.render(text, True, color)
+    text_surface = _render_text(text, size, color)
     text_rect = text_surface.get_rect()
     if center:
         text_rect.center = (x, y)
@@ -88,16 +133,56 @@ def draw_text(surface, text, size, x, y, color=WHITE, center=False):
         text_rect.topleft = (x, y)
     surface.blit(text_surface, text_rect)
 
+def get_polygon_bounds(points):
+    """Gets the float bounds (min_x, min_y, max_x, max_y) of a non-empty list of points."""
+    xs, ys = zip(*points) # One pass splits the coordinates; min/max then run in C
+    return min(xs), min(ys), max(xs), max(ys)
+
 def get_polygon_rect(points):
     """Gets the bounding Rect for a list of points."""
     if not points:
         return pygame.Rect(0,0,0,0)
-    min_x = min(p[0] for p in points)
-    max_x = max(p[0] for p in points)
-    min_y = min(p[1] for p in points)
-    max_y = max(p[1] for p in points)
+    min_x, min_y, max_x, max_y = get_polygon_bounds(points)
     return pygame.Rect(min_x, min_y, max_x - min_x, max_y - min_y)
 
+# --- Spatial Hashing ---
+class SpatialHashGrid:
+    """Buckets items by the grid cells their rect overlaps, so lookups only visit nearby items."""
+    def __init__(self, cell_shift=6):
+        self.cell_shift = cell_shift # Cell size is 1 << cell_shift pixels (64px, ~2x the largest body)
+        self.cells = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, item, rect):
+        shift = self.cell_shift
+        cells = self.cells
+        for cx in range(rect.left >> shift, (rect.right >> shift) + 1):
+            for cy in range(rect.top >> shift, (rect.bottom >> shift) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [item]
+                else:
+                    bucket.append(item)
+
+    def query(self, rect):
+        """Returns the items sharing a cell with rect (no duplicates, insertion order)."""
+        shift = self.cell_shift
+        cells = self.cells
+        found = {}
+        for cx in range(rect.left >> shift, (rect.right >> shift) + 1):
+            for cy in range(rect.top >> shift, (rect.bottom >> shift) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for item in bucket:
+                        found[id(item)] = item
+        return list(found.values())
+
+    def query_point(self, pos):
+        shift = self.cell_shift
+        return self.cells.get((int(pos[0]) >> shift, int(pos[1]) >> shift), ())
+
 # --- Enums ---
 class GameState(Enum):
     START_MENU = 1
@@ -124,10 +209,28 @@ class AIState(Enum):
     REPOSITIONING = 6
     AVOIDING = 7 # Specific state for avoiding immediate danger
 
+# Shoulder square corners as (forward, sideways) offsets from the shoulder center
+SHOULDER_CORNERS = [(-SHOULDER_SIZE / 2, -SHOULDER_SIZE / 2), (SHOULDER_SIZE / 2, -SHOULDER_SIZE / 2),
+                    (SHOULDER_SIZE / 2, SHOULDER_SIZE / 2), (-SHOULDER_SIZE / 2, SHOULDER_SIZE / 2)]
+
+# --- Equipment Tables ---
+# Arm stats per equipment: (max_length or None for shoulder-only, extend_speed, retract_speed)
+ARM_EQUIPMENT_STATS = {
+    EquipmentType.NONE: (DEFAULT_ARM_LENGTH * 0.7, BARE_HAND_EXTEND_SPEED, DEFAULT_ARM_RETRACT_SPEED * 1.5), # Punch reach, faster retraction
+    EquipmentType.SWORD: (DEFAULT_ARM_LENGTH, SWORD_EXTEND_SPEED, DEFAULT_ARM_RETRACT_SPEED),
+    EquipmentType.DAGGER: (DEFAULT_ARM_LENGTH * 0.6, DAGGER_EXTEND_SPEED, DEFAULT_ARM_RETRACT_SPEED), # Daggers are shorter
+    EquipmentType.SHIELD: (None, 0, 0), # Shield doesn't extend the arm
+}
+# Blade (length, width) for bladed equipment
+BLADE_SIZES = {
+    EquipmentType.SWORD: (SWORD_LENGTH, SWORD_WIDTH),
+    EquipmentType.DAGGER: (DAGGER_LENGTH, DAGGER_WIDTH),
+}
+
 # --- Base Classes ---
 class GameObject(pygame.sprite.Sprite):
     def __init__(self, pos, groups=None):
-        super().__init__(groups or [])
+        super().__init__(groups if groups is not None else []) # An empty Group is falsy, so don't use `or`
         self.pos = pygame.Vector2(pos)
         self.image = None # Must be set by subclass
         self.rect = None  # Must be set by subclass
@@ -140,12 +243,6 @@ class GameObject(pygame.sprite.Sprite):
             surface.blit(self.image, self.rect.move(camera_offset))
 
 # --- Environment Objects ---
-class Cobblestone:
-    def __init__(self, pos, radius):
-        self.pos = pos
-        self.radius = radius
-        self.color = random.choice([GREY, DARK_GREY, LIGHT_GREY])
-
 class Obstacle(GameObject):
     def __init__(self, pos, radius, groups):
         super().__init__(pos, groups)
@@ -156,12 +253,9 @@ class Obstacle(GameObject):
         self.rect = self.image.get_rect(center=self.pos)
         self.is_locked = True # Obstacles don't move
 
-    def draw(self, surface, camera_offset):
-         # Adjust position for drawing based on camera
-        draw_pos = self.pos + camera_offset
-        pygame.draw.circle(surface, self.color, draw_pos, self.radius)
-        # Update rect for potential interactions if needed (though locked objects usually don't need it)
-        self.rect.center = draw_pos
+    def draw_to_static(self, surface):
+        # Drawn once into the game's static layer (world coordinates, no camera offset)
+        pygame.draw.circle(surface, self.color, self.pos, self.radius)
 
 class TreeTrunk(GameObject):
     def __init__(self, pos, radius, groups):
@@ -173,10 +267,8 @@ class TreeTrunk(GameObject):
         self.rect = self.image.get_rect(center=self.pos)
         self.is_locked = True
 
-    def draw(self, surface, camera_offset):
-        draw_pos = self.pos + camera_offset
-        pygame.draw.circle(surface, self.color, draw_pos, self.radius)
-        self.rect.center = draw_pos
+    def draw_to_static(self, surface):
+        pygame.draw.circle(surface, self.color, self.pos, self.radius)
 
 
 class TreeFoliage(GameObject):
@@ -189,24 +281,23 @@ class TreeFoliage(GameObject):
         self.base_image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
         pygame.draw.circle(self.base_image, self.dark_color, (self.radius, self.radius), self.radius)
         pygame.draw.circle(self.base_image, self.color, (self.radius, self.radius), self.radius-3)
-        self.image = self.base_image.copy() # Image used for drawing (can change alpha)
+        # Both alpha variants are made up front; transparency changes just swap the image
+        self.faded_image = self.base_image.copy()
+        self.faded_image.set_alpha(100)
+        self.image = self.base_image # Image used for drawing
         self.rect = self.image.get_rect(center=self.pos)
         self.alpha = 255
 
-    def update_transparency(self, character_rects):
-        is_overlapping = False
-        for char_rect in character_rects:
-             # Use inflated rect for slightly earlier fade
-            if self.rect.colliderect(char_rect.inflate(20, 20)):
-                is_overlapping = True
-                break
+    def update_transparency(self, character_grid):
+        # Grid holds character rects already inflated for a slightly earlier fade;
+        # the nearby ones are then tested in one C-level collidelist call
+        is_overlapping = self.rect.collidelist(character_grid.query(self.rect)) != -1
 
         target_alpha = 100 if is_overlapping else 255
         if self.alpha != target_alpha:
             # Simple immediate alpha change, could be smoothed
             self.alpha = target_alpha
-            self.image = self.base_image.copy()
-            self.image.set_alpha(self.alpha)
+            self.image = self.faded_image if is_overlapping else self.base_image
 
     def draw(self, surface, camera_offset):
         draw_pos = self.pos + camera_offset
@@ -217,6 +308,7 @@ class Campfire(GameObject):
     def __init__(self, pos, size, groups):
         super().__init__(pos, groups)
         self.size = size
+        self.half_size = size / 2
         self.color_base = BROWN
         self.color_outer = RED
         self.color_inner = YELLOW
@@ -239,7 +331,7 @@ class Campfire(GameObject):
         bottom_y = draw_rect.bottom
         tip_y_base = draw_rect.top
         height = draw_rect.height
-        bob_offset = math.sin(self.bob_time) * height * self.bob_amount
+        bob_offset = cos_sin_deg(math.degrees(self.bob_time))[1] * height * self.bob_amount
 
         tip_y_outer = tip_y_base - bob_offset
         tip_y_inner = tip_y_base - bob_offset * 0.6 # Inner bobs slightly less
@@ -260,36 +352,82 @@ class Campfire(GameObject):
         ]
         pygame.draw.polygon(surface, self.color_inner, points_inner)
 
-class BloodSplatter(GameObject):
-    def __init__(self, pos, size, duration=2.0):
-        super().__init__(pos)
-        self.size = int(size)
+class BloodSplatterPool:
+    """All live blood splatters, stored column-wise (one list per field) instead of one sprite each."""
+    __slots__ = ('duration', 'initial_alpha', 'alpha_step', 'images', 'faded_images', 'xs', 'ys', 'sizes', 'timers')
+
+    def __init__(self, duration=2.0):
         self.duration = duration
-        self.timer = 0
-        self.color = BLOOD_COLOR
-        # Create a simple splatter graphic (random circle)
-        self.image = pygame.Surface((self.size*2, self.size*2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, self.color, (self.size, self.size), self.size)
-        self.rect = self.image.get_rect(center=self.pos)
         self.initial_alpha = 180
-        self.image.set_alpha(self.initial_alpha)
-
+        self.alpha_step = 4 # Fade in steps of 4 alpha; smaller changes aren't visible
+        self.images = {} # size -> base circle surface
+        self.faded_images = {} # (size, alpha level) -> copy of the base circle with that alpha, built lazily
+        self.clear()
+
+    def clear(self):
+        self.xs = []
+        self.ys = []
+        self.sizes = []
+        self.timers = []
+
+    def add(self, pos, size):
+        size = int(size)
+        image = self.images.get(size)
+        if image is None:
+            image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(image, BLOOD_COLOR, (size, size), size)
+            self.images[size] = image
+        rect = image.get_rect(center=pos)
+        self.xs.append(rect.x)
+        self.ys.append(rect.y)
+        self.sizes.append(size)
+        self.timers.append(0)
 
     def update(self, dt):
-        self.timer += dt
-        if self.timer >= self.duration:
-            self.kill() # Remove from sprite group
-        else:
-            # Fade out
-            alpha = int(self.initial_alpha * (1 - (self.timer / self.duration)))
-            self.image.set_alpha(max(0, alpha))
+        duration = self.duration
+        timers = [timer + dt for timer in self.timers]
+        if timers and timers[0] >= duration:
+            # Splatters share one duration, so expired ones are always at the front
+            expired = 1
+            while expired < len(timers) and timers[expired] >= duration:
+                expired += 1
+            del self.xs[:expired], self.ys[:expired], self.sizes[:expired], timers[:expired]
+        self.timers = timers
+
+    def get_faded_image(self, size, level):
+        image = self.images[size].copy()
+        image.set_alpha(level * self.alpha_step)
+        self.faded_images[(size, level)] = image
+        return image
 
     def draw(self, surface, camera_offset):
-        surface.blit(self.image, self.rect.move(camera_offset))
+        faded_images = self.faded_images
+        initial_alpha, duration, alpha_step = self.initial_alpha, self.duration, self.alpha_step
+        off_x, off_y = camera_offset
+        blit_list = []
+        for x, y, size, timer in zip(self.xs, self.ys, self.sizes, self.timers):
+            level = max(0, int(initial_alpha * (1 - timer / duration))) // alpha_step
+            image = faded_images.get((size, level))
+            if image is None:
+                image = self.get_faded_image(size, level)
+            blit_list.append((image, (x + off_x, y + off_y)))
+        surface.blits(blit_list, False)
 
 
 # --- Character Related Classes ---
 class Arm:
+    __slots__ = ('character', 'hand_side', 'shoulder_size', 'base_length', 'max_length', 'current_length',
+                 'extend_speed', 'retract_speed', 'is_extending', 'is_retracting',
+                 'target_angle_offset', 'current_angle_offset', 'max_rot_speed', 'min_angle_offset', 'max_angle_offset',
+                 'equipment', 'blade_length', 'blade_width', 'has_blade', 'has_shield', 'is_bare_hand',
+                 'build_equipment_poly', 'draw_equipment', 'can_attack_this_swing',
+                 'collision_poly', 'hand_pos', 'shoulder_pos', 'shoulder_offset',
+                 'body_cos', 'body_sin', 'arm_cos', 'arm_sin',
+                 'shield_hit_timer', 'shield_hit_duration', 'shield_hit_target_offset_delta', 'shield_hit_base_offset')
+
+    # (color, whole degrees) -> rotated shoulder square, filled lazily and shared by every arm
+    rotated_shoulders = {}
+
     def __init__(self, character, hand_side):
         self.character = character
         self.hand_side = hand_side # Hand.LEFT or Hand.RIGHT
@@ -305,44 +443,49 @@ class Arm:
         self.current_angle_offset = 0 # Relative to character angle
         self.max_rot_speed = ARM_ROT_SPEED # degrees per second
         self.equipment = EquipmentType.NONE
+        self.blade_length = self.blade_width = 0
+        self.has_blade = self.has_shield = False
+        self.is_bare_hand = True
+        self.build_equipment_poly = self._bare_hand_poly
+        self.draw_equipment = self._draw_no_equipment
         self.can_attack_this_swing = False # For bare hands
 
         # Angle limits relative to character forward direction (0 degrees)
         self.min_angle_offset = -45 # Backwards
         self.max_angle_offset = 135 # Forwards
 
+        # Geometry is kept as plain (x, y) float pairs; Vector2 math accepts them where needed
         self.collision_poly = [] # Store points for collision detection
-        self.hand_pos = pygame.Vector2(0, 0)
-        self.shoulder_pos = pygame.Vector2(0, 0)
+        self.hand_pos = (0.0, 0.0)
+        self.shoulder_pos = (0.0, 0.0)
+        self.shoulder_offset = (0.0, 0.0) # Shoulder relative to character center
+        self.body_cos, self.body_sin = 1.0, 0.0 # Unit vector of character facing
+        self.arm_cos, self.arm_sin = 1.0, 0.0 # Unit vector along the arm (across it is (-sin, cos))
 
         # Shield specific animation
         self.shield_hit_timer = 0.0
         self.shield_hit_duration = 0.3 # How long the knockback effect lasts
         self.shield_hit_target_offset_delta = -90 # Degrees to rotate back
 
+        self.update_geometry() # Valid geometry before the first update (e.g. enemies spawned mid-frame)
 
     def set_equipment(self, equipment_type):
         self.equipment = equipment_type
-        if self.equipment == EquipmentType.SWORD:
-            self.max_length = DEFAULT_ARM_LENGTH
-            self.extend_speed = SWORD_EXTEND_SPEED
-            self.retract_speed = DEFAULT_ARM_RETRACT_SPEED # Adjust if needed
-        elif self.equipment == EquipmentType.DAGGER:
-            self.max_length = DEFAULT_ARM_LENGTH * 0.6 # Daggers are shorter
-            self.extend_speed = DAGGER_EXTEND_SPEED
-            self.retract_speed = DEFAULT_ARM_RETRACT_SPEED
-        elif self.equipment == EquipmentType.SHIELD:
-            self.max_length = self.base_length # Shield doesn't really extend arm length itself
-            self.extend_speed = 0 # Cannot extend 'arm' with shield
-            self.retract_speed = 0
-        else: # Bare hand
-            self.max_length = DEFAULT_ARM_LENGTH * 0.7 # Punch reach
-            self.extend_speed = BARE_HAND_EXTEND_SPEED
-            self.retract_speed = DEFAULT_ARM_RETRACT_SPEED * 1.5 # Faster retraction
+        max_length, self.extend_speed, self.retract_speed = ARM_EQUIPMENT_STATS[equipment_type]
+        self.max_length = self.base_length if max_length is None else max_length
+        self.blade_length, self.blade_width = BLADE_SIZES.get(equipment_type, (0, 0))
+        # Kind flags read by combat code, so it never compares Enums per frame
+        self.has_blade = self.blade_length > 0
+        self.has_shield = equipment_type == EquipmentType.SHIELD
+        self.is_bare_hand = equipment_type == EquipmentType.NONE
+        # Bind the per-equipment routines once so geometry/draw don't re-check the type every frame
+        poly_name, draw_name = Arm.EQUIPMENT_ROUTINES[equipment_type]
+        self.build_equipment_poly = getattr(self, poly_name)
+        self.draw_equipment = getattr(self, draw_name)
 
 
     def start_extend(self, target_world_angle):
-        if self.equipment != EquipmentType.SHIELD: # Shields don't extend
+        if not self.has_shield: # Shields don't extend
             self.is_extending = True
             self.is_retracting = False
             # Set initial angle towards target, respecting limits
@@ -351,7 +494,7 @@ class Arm:
             if target_offset > 180: target_offset -= 360
             self.current_angle_offset = max(self.min_angle_offset, min(self.max_angle_offset, target_offset))
             self.target_angle_offset = self.current_angle_offset # Start aiming where it snaps
-            if self.equipment == EquipmentType.NONE:
+            if self.is_bare_hand:
                 self.can_attack_this_swing = True # Enable bare hand attack
 
 
@@ -389,10 +532,10 @@ class Arm:
                 if self.current_length >= self.max_length:
                     self.current_length = self.max_length
                     # If bare hand, attack frame is when it hits max length
-                    if self.equipment == EquipmentType.NONE:
+                    if self.is_bare_hand:
                         pass # Attack check happens in collision phase
             else: # Reached max length
-                 if self.equipment == EquipmentType.NONE:
+                 if self.is_bare_hand:
                       self.can_attack_this_swing = False # Can only hit on the way out/at the end frame
 
         elif self.is_retracting:
@@ -404,70 +547,81 @@ class Arm:
             else:
                 self.is_retracting = False
 
+        self.update_geometry()
+
+    def update_geometry(self):
+        """Recomputes shoulder, hand and collision polygon from the current angles.
+
+        Uses one cos/sin pair for the body facing and one for the arm; every
+        offset below is a scaled copy of those unit vectors, on plain floats.
+        """
         # --- Calculate Geometry ---
-        # Shoulder position: rotate offset vector from center
-        shoulder_offset_dist = self.character.radius
-        shoulder_angle = self.character.angle + (90 if self.hand_side == Hand.LEFT else -90)
-        self.shoulder_pos = self.character.pos + pygame.Vector2(shoulder_offset_dist, 0).rotate(shoulder_angle)
-
-        # Hand position: extend from shoulder along arm angle
-        total_arm_angle = self.character.angle + self.current_angle_offset
-        self.hand_pos = self.shoulder_pos + pygame.Vector2(self.current_length - self.base_length, 0).rotate(total_arm_angle) # Extend from shoulder joint
-
-        # --- Calculate Collision Polygon ---
-        arm_width = self.shoulder_size
-        arm_vector = pygame.Vector2(1, 0).rotate(total_arm_angle)
-        perp_vector = pygame.Vector2(0, 1).rotate(total_arm_angle) # Perpendicular to arm
-
-        # Define corners relative to shoulder pos
-        p1 = self.shoulder_pos - perp_vector * arm_width / 2
-        p2 = self.shoulder_pos + perp_vector * arm_width / 2
-        p3 = p2 + arm_vector * (self.current_length - self.base_length)
-        p4 = p1 + arm_vector * (self.current_length - self.base_length)
-
-        # Add weapon/shield geometry if equipped
-        if self.equipment == EquipmentType.SWORD or self.equipment == EquipmentType.DAGGER:
-            length = SWORD_LENGTH if self.equipment == EquipmentType.SWORD else DAGGER_LENGTH
-            width = SWORD_WIDTH if self.equipment == EquipmentType.SWORD else DAGGER_WIDTH
-            w_p1 = self.hand_pos - perp_vector * width / 2
-            w_p2 = self.hand_pos + perp_vector * width / 2
-            w_p3 = w_p2 + arm_vector * length
-            w_p4 = w_p1 + arm_vector * length
-            self.collision_poly = [p1, p2, w_p3, w_p4] # Combine arm base and weapon blade/handle area approx
-
-        elif self.equipment == EquipmentType.SHIELD:
-             # Shield sits tangent at hand position. Its angle is perp to arm angle.
-            shield_angle = total_arm_angle + 90 # Angle of the shield's face
-            shield_center = self.hand_pos # Place shield center at hand
-            half_width_vec = pygame.Vector2(SHIELD_WIDTH / 2, 0).rotate(shield_angle)
-            half_height_vec = pygame.Vector2(SHIELD_HEIGHT / 2, 0).rotate(shield_angle + 90) # Perpendicular to face
-
-            s_p1 = shield_center - half_width_vec - half_height_vec
-            s_p2 = shield_center + half_width_vec - half_height_vec
-            s_p3 = shield_center + half_width_vec + half_height_vec
-            s_p4 = shield_center - half_width_vec + half_height_vec
-            self.collision_poly = [s_p1, s_p2, s_p3, s_p4]
-
-        else: # Bare hand or just shoulder
-            # If arm is extended beyond shoulder, use arm poly, else just shoulder square poly
-            if self.current_length > self.base_length:
-                 self.collision_poly = [p1, p2, p3, p4]
-            else:
-                 # Calculate shoulder square polygon based on character angle
-                 shoulder_center_offset = pygame.Vector2(self.character.radius, 0).rotate(shoulder_angle)
-                 shoulder_center = self.character.pos + shoulder_center_offset
-                 half_size_vec_x = pygame.Vector2(self.shoulder_size / 2, 0).rotate(self.character.angle)
-                 half_size_vec_y = pygame.Vector2(0, self.shoulder_size / 2).rotate(self.character.angle)
-
-                 sh_p1 = shoulder_center - half_size_vec_x - half_size_vec_y
-                 sh_p2 = shoulder_center + half_size_vec_x - half_size_vec_y
-                 sh_p3 = shoulder_center + half_size_vec_x + half_size_vec_y
-                 sh_p4 = shoulder_center - half_size_vec_x + half_size_vec_y
-                 self.collision_poly = [sh_p1, sh_p2, sh_p3, sh_p4]
+        body_cos, body_sin = cos_sin_deg(self.character.angle)
+        self.body_cos, self.body_sin = body_cos, body_sin
+
+        # Shoulder position: offset sideways (along the body perpendicular) from center
+        side_offset = self.character.radius * (1 if self.hand_side == Hand.LEFT else -1)
+        offset_x, offset_y = -body_sin * side_offset, body_cos * side_offset
+        self.shoulder_offset = (offset_x, offset_y)
+        char_x, char_y = self.character.pos
+        shoulder_x, shoulder_y = char_x + offset_x, char_y + offset_y
+        self.shoulder_pos = (shoulder_x, shoulder_y)
+
+        # Hand position: extend from shoulder joint along arm angle
+        arm_cos, arm_sin = cos_sin_deg(self.character.angle + self.current_angle_offset)
+        self.arm_cos, self.arm_sin = arm_cos, arm_sin
+        reach = self.current_length - self.base_length
+        self.hand_pos = (shoulder_x + arm_cos * reach, shoulder_y + arm_sin * reach)
+
+        self.build_equipment_poly()
+
+    # --- Collision polygons per equipment (bound in set_equipment) ---
+    def _arm_corners(self):
+        """Shoulder-side corners of the arm rectangle (p1, p2)."""
+        half_width = self.shoulder_size / 2
+        across_x, across_y = -self.arm_sin * half_width, self.arm_cos * half_width
+        shoulder_x, shoulder_y = self.shoulder_pos
+        return (shoulder_x - across_x, shoulder_y - across_y), (shoulder_x + across_x, shoulder_y + across_y)
+
+    def _blade_poly(self):
+        p1, p2 = self._arm_corners()
+        hand_x, hand_y = self.hand_pos
+        half_width = self.blade_width / 2
+        across_x, across_y = -self.arm_sin * half_width, self.arm_cos * half_width
+        blade_x, blade_y = self.arm_cos * self.blade_length, self.arm_sin * self.blade_length
+        w_p3 = (hand_x + across_x + blade_x, hand_y + across_y + blade_y)
+        w_p4 = (hand_x - across_x + blade_x, hand_y - across_y + blade_y)
+        self.collision_poly = [p1, p2, w_p3, w_p4] # Combine arm base and weapon blade/handle area approx
+
+    def _shield_poly(self):
+        # Shield sits tangent at hand position. Its face runs along the arm's perpendicular.
+        hand_x, hand_y = self.hand_pos # Place shield center at hand
+        half_w_x, half_w_y = -self.arm_sin * (SHIELD_WIDTH / 2), self.arm_cos * (SHIELD_WIDTH / 2)
+        half_h_x, half_h_y = self.arm_cos * (-SHIELD_HEIGHT / 2), self.arm_sin * (-SHIELD_HEIGHT / 2) # Perpendicular to face
+
+        s_p1 = (hand_x - half_w_x - half_h_x, hand_y - half_w_y - half_h_y)
+        s_p2 = (hand_x + half_w_x - half_h_x, hand_y + half_w_y - half_h_y)
+        s_p3 = (hand_x + half_w_x + half_h_x, hand_y + half_w_y + half_h_y)
+        s_p4 = (hand_x - half_w_x + half_h_x, hand_y - half_w_y + half_h_y)
+        self.collision_poly = [s_p1, s_p2, s_p3, s_p4]
+
+    def _bare_hand_poly(self):
+        # If arm is extended beyond shoulder, use arm poly, else just shoulder square poly
+        if self.current_length > self.base_length:
+            (p1_x, p1_y), (p2_x, p2_y) = self._arm_corners()
+            reach = self.current_length - self.base_length
+            reach_x, reach_y = self.arm_cos * reach, self.arm_sin * reach
+            self.collision_poly = [(p1_x, p1_y), (p2_x, p2_y), (p2_x + reach_x, p2_y + reach_y), (p1_x + reach_x, p1_y + reach_y)]
+        else:
+            # Shoulder square: rotate the (forward, sideways) corner template by the body angle
+            shoulder_x, shoulder_y = self.shoulder_pos
+            c, s = self.body_cos, self.body_sin
+            self.collision_poly = [(shoulder_x + c * fwd - s * side, shoulder_y + s * fwd + c * side)
+                                   for fwd, side in SHOULDER_CORNERS]
 
     def trigger_shield_hit(self):
         """Called when this arm's shield is hit by a weapon."""
-        if self.equipment == EquipmentType.SHIELD and self.shield_hit_timer <= 0:
+        if self.has_shield and self.shield_hit_timer <= 0:
              # Need to store the angle *before* the hit starts
              self.shield_hit_base_offset = self.current_angle_offset
              self.shield_hit_timer = self.shield_hit_duration
@@ -475,70 +629,84 @@ class Arm:
 
     def draw(self, surface, camera_offset):
         # --- Draw Shoulder ---
-        # Calculate shoulder center based on current character pos and angle
-        shoulder_offset_dist = self.character.radius
-        shoulder_angle = self.character.angle + (90 if self.hand_side == Hand.LEFT else -90)
-        shoulder_center = self.character.pos + pygame.Vector2(shoulder_offset_dist, 0).rotate(shoulder_angle)
-
-        # Create a square surface for the shoulder
-        shoulder_surf = pygame.Surface((self.shoulder_size, self.shoulder_size), pygame.SRCALPHA)
-        shoulder_surf.fill(self.character.color)
-        rotated_shoulder = pygame.transform.rotate(shoulder_surf, self.character.angle)
+        # Shoulder center from the current character pos (collisions may have moved it since update)
+        shoulder_center = self.character.pos + self.shoulder_offset
+
+        # Look up the shoulder square pre-rotated to the nearest degree (rotated once per color/angle)
+        key = (self.character.color, round(self.character.angle) % 360)
+        rotated_shoulder = Arm.rotated_shoulders.get(key)
+        if rotated_shoulder is None:
+            shoulder_surf = pygame.Surface((self.shoulder_size, self.shoulder_size), pygame.SRCALPHA)
+            shoulder_surf.fill(self.character.color)
+            rotated_shoulder = pygame.transform.rotate(shoulder_surf, key[1])
+            Arm.rotated_shoulders[key] = rotated_shoulder
         shoulder_rect = rotated_shoulder.get_rect(center=shoulder_center + camera_offset)
         surface.blit(rotated_shoulder, shoulder_rect)
 
         # --- Draw Arm Extension ---
+        off_x, off_y = camera_offset
         if self.current_length > self.base_length:
-            # Draw rectangle from shoulder joint along arm angle
-            total_arm_angle = self.character.angle + self.current_angle_offset
-            arm_vector = pygame.Vector2(1, 0).rotate(total_arm_angle)
-            perp_vector = pygame.Vector2(0, 1).rotate(total_arm_angle)
-            arm_width = self.shoulder_size # Arm width is same as shoulder
+            # Draw rectangle from shoulder joint along arm angle (arm width is same as shoulder)
+            shoulder_x, shoulder_y = self.shoulder_pos
+            half_width = self.shoulder_size / 2
+            across_x, across_y = -self.arm_sin * half_width, self.arm_cos * half_width
             arm_draw_length = self.current_length - self.base_length
+            reach_x, reach_y = self.arm_cos * arm_draw_length, self.arm_sin * arm_draw_length
 
             # Calculate the 4 points of the arm rectangle polygon
-            p1 = self.shoulder_pos - perp_vector * arm_width / 2 + camera_offset
-            p2 = self.shoulder_pos + perp_vector * arm_width / 2 + camera_offset
-            p3 = p2 + arm_vector * arm_draw_length
-            p4 = p1 + arm_vector * arm_draw_length
-            pygame.draw.polygon(surface, self.character.color, [p1, p2, p3, p4])
+            p1_x, p1_y = shoulder_x - across_x + off_x, shoulder_y - across_y + off_y
+            p2_x, p2_y = shoulder_x + across_x + off_x, shoulder_y + across_y + off_y
+            pygame.draw.polygon(surface, self.character.color,
+                                [(p1_x, p1_y), (p2_x, p2_y), (p2_x + reach_x, p2_y + reach_y), (p1_x + reach_x, p1_y + reach_y)])
 
         # --- Draw Equipment ---
-        hand_draw_pos = self.hand_pos + camera_offset
-        total_arm_angle = self.character.angle + self.current_angle_offset
-
-        if self.equipment == EquipmentType.SWORD or self.equipment == EquipmentType.DAGGER:
-            length = SWORD_LENGTH if self.equipment == EquipmentType.SWORD else DAGGER_LENGTH
-            width = SWORD_WIDTH if self.equipment == EquipmentType.SWORD else DAGGER_WIDTH
-            color = GREY
-
-            # Polygon for the weapon rectangle pointing away from hand
-            weapon_vector = pygame.Vector2(1, 0).rotate(total_arm_angle)
-            perp_vector = pygame.Vector2(0, 1).rotate(total_arm_angle)
-
-            wp1 = hand_draw_pos - perp_vector * width / 2
-            wp2 = hand_draw_pos + perp_vector * width / 2
-            wp3 = wp2 + weapon_vector * length
-            wp4 = wp1 + weapon_vector * length
-            pygame.draw.polygon(surface, color, [wp1, wp2, wp3, wp4])
-
-        elif self.equipment == EquipmentType.SHIELD:
-             # Polygon for the shield rectangle tangent at hand
-            shield_angle = total_arm_angle + 90 # Angle of the shield's face
-            shield_center = hand_draw_pos
-            half_width_vec = pygame.Vector2(SHIELD_WIDTH / 2, 0).rotate(shield_angle)
-            half_height_vec = pygame.Vector2(SHIELD_HEIGHT / 2, 0).rotate(shield_angle + 90)
-
-            sp1 = shield_center - half_width_vec - half_height_vec
-            sp2 = shield_center + half_width_vec - half_height_vec
-            sp3 = shield_center + half_width_vec + half_height_vec
-            sp4 = shield_center - half_width_vec + half_height_vec
-            pygame.draw.polygon(surface, GREY, [sp1, sp2, sp3, sp4])
+        hand_x, hand_y = self.hand_pos
+        self.draw_equipment(surface, hand_x + off_x, hand_y + off_y)
+
+    # --- Equipment drawing (bound in set_equipment) ---
+    def _draw_blade(self, surface, hand_x, hand_y):
+        # Polygon for the weapon rectangle pointing away from hand
+        half_width = self.blade_width / 2
+        across_x, across_y = -self.arm_sin * half_width, self.arm_cos * half_width
+        blade_x, blade_y = self.arm_cos * self.blade_length, self.arm_sin * self.blade_length
+
+        wp1_x, wp1_y = hand_x - across_x, hand_y - across_y
+        wp2_x, wp2_y = hand_x + across_x, hand_y + across_y
+        pygame.draw.polygon(surface, GREY, [(wp1_x, wp1_y), (wp2_x, wp2_y), (wp2_x + blade_x, wp2_y + blade_y), (wp1_x + blade_x, wp1_y + blade_y)])
+
+    def _draw_shield(self, surface, hand_x, hand_y):
+        # Polygon for the shield rectangle tangent at hand
+        half_w_x, half_w_y = -self.arm_sin * (SHIELD_WIDTH / 2), self.arm_cos * (SHIELD_WIDTH / 2)
+        half_h_x, half_h_y = self.arm_cos * (-SHIELD_HEIGHT / 2), self.arm_sin * (-SHIELD_HEIGHT / 2)
+
+        sp1 = (hand_x - half_w_x - half_h_x, hand_y - half_w_y - half_h_y)
+        sp2 = (hand_x + half_w_x - half_h_x, hand_y + half_w_y - half_h_y)
+        sp3 = (hand_x + half_w_x + half_h_x, hand_y + half_w_y + half_h_y)
+        sp4 = (hand_x - half_w_x + half_h_x, hand_y - half_w_y + half_h_y)
+        pygame.draw.polygon(surface, GREY, [sp1, sp2, sp3, sp4])
+
+    def _draw_no_equipment(self, surface, hand_x, hand_y):
+        pass
+
+    # Method names per equipment: (collision polygon builder, equipment drawer)
+    EQUIPMENT_ROUTINES = {
+        EquipmentType.NONE: ("_bare_hand_poly", "_draw_no_equipment"),
+        EquipmentType.SWORD: ("_blade_poly", "_draw_blade"),
+        EquipmentType.DAGGER: ("_blade_poly", "_draw_blade"),
+        EquipmentType.SHIELD: ("_shield_poly", "_draw_shield"),
+    }
 
 
 class Character(GameObject):
+    # pygame's Sprite base keeps a __dict__, so these slots only speed up the hot per-frame attributes
+    __slots__ = ('game', 'vel', 'angle', 'target_angle', 'body_rot_speed', 'radius', 'color', 'max_hp', 'current_hp',
+                 'is_dead', 'knockback_vel', 'left_arm', 'right_arm', 'arms', 'collision_radius', 'collision_polys', 'collision_aabb', 'body_rect_for_roof')
+
     def __init__(self, pos, groups=None):
+        self._layer = int(pos[1]) # Initial draw layer (depth) when added to the draw_sorted LayeredUpdates group
         super().__init__(pos, groups)
+        # Game instance, resolved once here instead of via self.groups()[0].game (gone after kill())
+        self.game = groups[0].game if groups else None
         self.vel = pygame.Vector2(0, 0)
         self.angle = 0.0 # degrees, 0 is right
         self.target_angle = 0.0
@@ -549,7 +717,6 @@ class Character(GameObject):
         self.current_hp = self.max_hp
         self.is_dead = False
         self.knockback_vel = pygame.Vector2(0, 0)
-        self.knockback_decay = 0.85 # Multiplier per frame
 
         self.left_arm = Arm(self, Hand.LEFT)
         self.right_arm = Arm(self, Hand.RIGHT)
@@ -557,6 +724,10 @@ class Character(GameObject):
 
         # Simplified collision shape for body-body interaction
         self.collision_radius = self.radius
+        # Collision shapes cached for handle_collisions, refreshed at the end of update:
+        # the body circle is (pos, collision_radius), arms are [(poly_points, arm, bounds), ...]
+        self.collision_polys = self.get_collision_polys()
+        self.collision_aabb = self.get_collision_aabb() # Broad-phase bound, refreshed at the end of update
 
         # Used for roof transparency check
         self.body_rect_for_roof = pygame.Rect(0,0,0,0)
@@ -566,41 +737,41 @@ class Character(GameObject):
         self.left_arm.set_equipment(left_eq)
         self.right_arm.set_equipment(right_eq)
 
-    def update(self, dt, all_collidables, hazards):
+    def update(self, dt, all_collidables, hazards, mouse_pos=None, mouse_buttons=None, player=None):
+        """mouse_pos/mouse_buttons are polled once per frame by Game.update; only the Player uses them.
+        player is Game.player, passed down so enemies don't have to search for it."""
         if self.is_dead:
             return
 
         # Apply movement velocity
         self.pos += self.vel * dt
 
-        # Apply and decay knockback
-        self.pos += self.knockback_vel * dt
-        self.knockback_vel *= self.knockback_decay
-        if self.knockback_vel.length_squared() < 1:
-            self.knockback_vel = pygame.Vector2(0, 0)
+        # Apply and decay knockback (frame-rate independent); nothing to do when at rest
+        if self.knockback_vel:
+            self.pos += self.knockback_vel * dt
+            self.knockback_vel *= knockback_decay_factor(dt)
+            if self.knockback_vel.length_squared() < 1:
+                self.knockback_vel.update(0, 0)
 
         # Rotate body towards target angle
         self.angle = angle_lerp(self.angle, self.target_angle, self.body_rot_speed / 360.0, dt)
 
         # Update arms
-        mouse_pos = pygame.mouse.get_pos() # Player needs this, pass appropriately for AI
-        # Convert mouse pos to world coords if camera is used
-        world_mouse_pos = mouse_pos # Assuming no camera for now, adjust if added
-        left_target_angle = (pygame.Vector2(world_mouse_pos) - self.left_arm.shoulder_pos).angle_to(pygame.Vector2(1, 0))
-        right_target_angle = (pygame.Vector2(world_mouse_pos) - self.right_arm.shoulder_pos).angle_to(pygame.Vector2(1, 0))
-
         # --- Player specific arm targeting ---
         if isinstance(self, Player):
-             mouse_pressed = pygame.mouse.get_pressed()
-             if mouse_pressed[0]: # Left mouse
-                 self.left_arm.update(dt, left_target_angle)
+             # Convert mouse pos to world coords if camera is used
+             mouse_x, mouse_y = mouse_pos # Assuming no camera for now, adjust if added
+             if mouse_buttons[0]: # Left mouse
+                 shoulder_x, shoulder_y = self.left_arm.shoulder_pos
+                 self.left_arm.update(dt, heading_deg(mouse_x - shoulder_x, mouse_y - shoulder_y))
              else:
                  # Aim non-active arm forward-ish relative to body? or keep last target?
                  idle_target_angle = self.angle + self.left_arm.target_angle_offset # Maintain relative angle
                  self.left_arm.update(dt, idle_target_angle)
 
-             if mouse_pressed[2]: # Right mouse
-                  self.right_arm.update(dt, right_target_angle)
+             if mouse_buttons[2]: # Right mouse
+                  shoulder_x, shoulder_y = self.right_arm.shoulder_pos
+                  self.right_arm.update(dt, heading_deg(mouse_x - shoulder_x, mouse_y - shoulder_y))
              else:
                   idle_target_angle = self.angle + self.right_arm.target_angle_offset
                   self.right_arm.update(dt, idle_target_angle)
@@ -612,8 +783,8 @@ class Character(GameObject):
                  left_target_pos = self.target_entity.pos
                  right_target_pos = self.target_entity.pos
                  # Could add slight offset/prediction based on target movement
-                 left_target_angle = (left_target_pos - self.left_arm.shoulder_pos).angle_to(pygame.Vector2(1, 0))
-                 right_target_angle = (right_target_pos - self.right_arm.shoulder_pos).angle_to(pygame.Vector2(1, 0))
+                 left_target_angle = heading_deg(left_target_pos.x - self.left_arm.shoulder_pos[0], left_target_pos.y - self.left_arm.shoulder_pos[1])
+                 right_target_angle = heading_deg(right_target_pos.x - self.right_arm.shoulder_pos[0], right_target_pos.y - self.right_arm.shoulder_pos[1])
                  self.left_arm.update(dt, left_target_angle)
                  self.right_arm.update(dt, right_target_angle)
             else: # Idle arm aiming (e.g., point forward relative to body)
@@ -627,10 +798,9 @@ class Character(GameObject):
             self.pos.x - self.radius, self.pos.y - self.radius,
             self.radius * 2, self.radius * 2
         )
-        # Check for hazard damage (e.g., campfire)
-        for hazard in hazards:
-             if hazard.hazard_shape.collidepoint(self.pos):
-                  self.take_damage(hazard.damage * dt, hazard.pos, apply_knockback=False) # Damage over time
+        self.collision_polys = self.get_collision_polys()
+        self.collision_aabb = self.get_collision_aabb()
+        # Hazard damage (e.g., campfire) is applied for all characters at once in Game.apply_hazards
 
 
     def apply_force(self, force_vector):
@@ -638,11 +808,18 @@ class Character(GameObject):
         self.knockback_vel += force_vector
 
     def apply_knockback(self, amount, source_pos):
-        if self.pos == source_pos: # Avoid division by zero if source is self center
-             direction = pygame.Vector2(random.uniform(-1, 1), random.uniform(-1, 1)).normalize()
+        # Works on raw floats; only the knockback velocity itself is a Vector2
+        dx = self.pos.x - source_pos[0]
+        dy = self.pos.y - source_pos[1]
+        dist_sq = dx * dx + dy * dy
+        if dist_sq == 0: # Avoid division by zero if source is self center
+             dx, dy = pygame.Vector2(random.uniform(-1, 1), random.uniform(-1, 1)).normalize()
+             scale = amount
         else:
-             direction = normalize_vector(self.pos - source_pos)
-        self.apply_force(direction * amount)
+             scale = amount / math.sqrt(dist_sq)
+        knockback_vel = self.knockback_vel
+        knockback_vel.x += dx * scale
+        knockback_vel.y += dy * scale
 
     def take_damage(self, amount, damage_source_pos, apply_knockback=True):
         if self.is_dead:
@@ -652,9 +829,7 @@ class Character(GameObject):
 
         # Add blood splatter effect
         splatter_size = 5 + amount * 5 # Scale size with damage
-        if 'blood_splatters_group' in self.groups()[0].game.sprite_groups: # Access game instance safely
-             splatter = BloodSplatter(self.pos + pygame.Vector2(random.uniform(-10, 10), random.uniform(-10, 10)), splatter_size)
-             self.groups()[0].game.sprite_groups['blood_splatters_group'].add(splatter)
+        self.game.blood_splatters.add(self.pos + pygame.Vector2(random.uniform(-10, 10), random.uniform(-10, 10)), splatter_size)
 
 
         if apply_knockback:
@@ -668,10 +843,11 @@ class Character(GameObject):
         self.is_dead = True
         self.current_hp = 0
         # Could add death animation/effect here
-        # Player death handled in Game class
+        # Leave every group, so the per-frame group loops (update, collisions, roof checks) only see the living.
+        # Player death itself is handled in Game class via self.player.is_dead
+        self.kill()
         if isinstance(self, Enemy):
-            self.kill() # Remove enemy sprite from groups
-            self.groups()[0].game.player_kills += 1 # Increment kill count
+            self.game.player_kills += 1 # Increment kill count
 
 
     def draw(self, surface, camera_offset):
@@ -693,80 +869,72 @@ class Character(GameObject):
             draw_text(surface, str(int(self.current_hp)), 20, draw_pos.x, draw_pos.y, WHITE, center=True)
 
     # --- Collision Shapes for Physics ---
-    def get_collision_shapes(self):
-        """Returns a list of shapes for collision checking: [('type', geometry, owner_object)]"""
-        shapes = []
-        # Body: Use self.pos as geometry, self (the Character instance) as owner
-        shapes.append(('circle', self.pos, self))
-
-        # Arms: Use arm.collision_poly as geometry, the arm instance as owner
-        if self.left_arm.collision_poly:
-            shapes.append(('poly', self.left_arm.collision_poly, self.left_arm))
-        if self.right_arm.collision_poly:
-            shapes.append(('poly', self.right_arm.collision_poly, self.right_arm))
-        return shapes
+    def get_collision_polys(self):
+        """Returns the arm polygons for collision checking: [(poly_points, arm, bounds)]"""
+        return [(arm.collision_poly, arm, get_polygon_bounds(arm.collision_poly)) for arm in self.arms if arm.collision_poly]
 
+    def get_collision_aabb(self):
+        """Rect bounding the body circle and both arm polygons (collision broad phase)."""
+        aabb = pygame.Rect(self.pos.x - self.collision_radius, self.pos.y - self.collision_radius,
+                           self.collision_radius * 2, self.collision_radius * 2)
+        for _, _, (min_x, min_y, max_x, max_y) in self.collision_polys:
+            aabb.union_ip(pygame.Rect(min_x, min_y, max_x - min_x, max_y - min_y))
+        return aabb.inflate(2, 2) # Rect truncates to ints; pad so the bound stays conservative
 
 
 class Player(Character):
+    __slots__ = ('speed', 'is_aiming')
+
     def __init__(self, pos, groups=None):
         super().__init__(pos, groups)
         self.body_rot_speed = PLAYER_ROT_SPEED
         self.speed = PLAYER_SPEED
         self.is_aiming = False # Body rotation fixed when aiming/attacking
 
-    def update(self, dt, all_collidables, hazards):
+    def update(self, dt, all_collidables, hazards, mouse_pos=None, mouse_buttons=None, player=None):
         # --- Movement Input ---
         keys = pygame.key.get_pressed()
-        move_dir = pygame.Vector2(0, 0)
-        if keys[pygame.K_w]:
-            move_dir.y -= 1
-        if keys[pygame.K_s]:
-            move_dir.y += 1
-        if keys[pygame.K_a]:
-            move_dir.x -= 1
-        if keys[pygame.K_d]:
-            move_dir.x += 1
-
-        move_dir = normalize_vector(move_dir)
+        # Opposite keys cancel out (True - True == 0)
+        move_dir = pygame.Vector2(keys[pygame.K_d] - keys[pygame.K_a], keys[pygame.K_s] - keys[pygame.K_w])
+        if move_dir.x or move_dir.y:
+            move_dir.normalize_ip()
         self.vel = move_dir * self.speed
 
         # --- Rotation and Arm Control Input ---
-        mouse_buttons = pygame.mouse.get_pressed()
-        mouse_pos_screen = pygame.mouse.get_pos()
         # Convert mouse screen coordinates to world coordinates if camera exists
-        # world_mouse_pos = screen_to_world(mouse_pos_screen, camera_offset)
-        world_mouse_pos = pygame.Vector2(mouse_pos_screen) # No camera yet
+        # world_mouse_pos = screen_to_world(mouse_pos, camera_offset)
+        mouse_x, mouse_y = mouse_pos # No camera yet; plain scalars, no Vector2 per frame
 
         self.is_aiming = mouse_buttons[0] or mouse_buttons[2]
 
         if not self.is_aiming:
             # Rotate body towards cursor when not attacking
-            direction_to_mouse = world_mouse_pos - self.pos
-            if direction_to_mouse.length() > 0:
-                self.target_angle = direction_to_mouse.angle_to(pygame.Vector2(1, 0))
+            mouse_dx = mouse_x - self.pos.x
+            mouse_dy = mouse_y - self.pos.y
+            if mouse_dx or mouse_dy:
+                self.target_angle = heading_deg(mouse_dx, mouse_dy)
         # Else: Body angle remains fixed while aiming/attacking
 
         # --- Arm Actions ---
-        left_target_angle = (world_mouse_pos - self.left_arm.shoulder_pos).angle_to(pygame.Vector2(1, 0))
-        right_target_angle = (world_mouse_pos - self.right_arm.shoulder_pos).angle_to(pygame.Vector2(1, 0))
-
+        # Target angles are only computed when an arm actually starts extending
         if mouse_buttons[0]: # Left click - extend/aim left arm
             if not self.left_arm.is_extending:
-                 self.left_arm.start_extend(left_target_angle)
+                 shoulder_x, shoulder_y = self.left_arm.shoulder_pos
+                 self.left_arm.start_extend(heading_deg(mouse_x - shoulder_x, mouse_y - shoulder_y))
         else:
             if self.left_arm.is_extending: # Button released
                  self.left_arm.start_retract()
 
         if mouse_buttons[2]: # Right click - extend/aim right arm
              if not self.right_arm.is_extending:
-                 self.right_arm.start_extend(right_target_angle)
+                 shoulder_x, shoulder_y = self.right_arm.shoulder_pos
+                 self.right_arm.start_extend(heading_deg(mouse_x - shoulder_x, mouse_y - shoulder_y))
         else:
              if self.right_arm.is_extending: # Button released
                  self.right_arm.start_retract()
 
         # Call parent update AFTER handling input (sets vel, target_angle, arm states)
-        super().update(dt, all_collidables, hazards) # Handles movement, rotation, arm updates
+        super().update(dt, all_collidables, hazards, mouse_pos, mouse_buttons) # Handles movement, rotation, arm updates
 
     def draw_ui(self, surface):
          # Health Bar Bottom Left
@@ -787,19 +955,24 @@ class Player(Character):
 
 
 class Enemy(Character):
+    __slots__ = ('speed', 'ai_profile', 'engage_state', 'ai_state', 'state_routine', 'state_timer', 'target_entity', 'move_target_pos',
+                 'aggro_radius', 'attack_radius', 'attack_cooldown', 'min_attack_interval', 'max_attack_interval',
+                 'preferred_circling_distance', 'circling_direction', 'circling_angle_offset')
+
     def __init__(self, pos, groups=None, ai_profile="standard"):
         super().__init__(pos, groups)
         self.body_rot_speed = ENEMY_ROT_SPEED
         self.speed = ENEMY_SPEED
         self.color = RED # Distinguish from player
         self.ai_state = AIState.IDLE
+        self.state_routine = self._ai_idle # Bound behaviour for ai_state, swapped in change_state
         self.ai_profile = ai_profile # e.g., "aggressive", "circler", "tester"
+        self.engage_state = Enemy.ENGAGE_STATES.get(ai_profile) # None: pick at random each time
         self.state_timer = random.uniform(1.0, 3.0)
         self.target_entity = None # Usually the player
         self.aggro_radius = 400
         self.attack_radius = (BODY_RADIUS + DEFAULT_ARM_LENGTH + SWORD_LENGTH) * 0.8 # Approx attack range
         self.preferred_circling_distance = random.uniform(150, 250)
-        self.avoid_radius = 80 # How close to check for avoidance
 
         # AI specific targets
         self.move_target_pos = None
@@ -812,7 +985,7 @@ class Enemy(Character):
         self.max_attack_interval = 3.0
 
 
-    def update(self, dt, all_collidables, hazards):
+    def update(self, dt, all_collidables, hazards, mouse_pos=None, mouse_buttons=None, player=None):
         if self.is_dead: return
 
         self.state_timer -= dt
@@ -821,13 +994,7 @@ class Enemy(Character):
         # --- Find Target (Player) ---
         # This assumes the player is the only target. Could be expanded.
         if not self.target_entity or self.target_entity.is_dead:
-            # Find the player instance (assuming one player)
-            player = None
-            for entity in all_collidables:
-                if isinstance(entity, Player):
-                    player = entity
-                    break
-            self.target_entity = player
+            self.target_entity = player if player and not player.is_dead else None
 
         if not self.target_entity:
             self.vel = pygame.Vector2(0,0) # No target, stop moving
@@ -846,20 +1013,26 @@ class Enemy(Character):
         direction_to_player = normalize_vector(self.target_entity.pos - self.pos)
 
         # --- Hazard Avoidance (High Priority) ---
-        avoid_vector = pygame.Vector2(0, 0)
+        # Runs on the game's hazard columns (plain floats) instead of per-hazard Vector2 math
+        game = self.game
+        pos_x, pos_y = self.pos
+        avoid_x = avoid_y = 0.0
         num_avoiding = 0
-        for hazard in hazards:
-            dist_sq = (hazard.pos - self.pos).length_squared()
-            avoid_dist_sq = (self.avoid_radius + hazard.size/2)**2 # Approx check distance
+        for hazard_x, hazard_y, avoid_dist_sq in zip(game.hazard_xs, game.hazard_ys, game.hazard_avoid_dist_sqs):
+            dx = pos_x - hazard_x
+            dy = pos_y - hazard_y
+            dist_sq = dx * dx + dy * dy
             if dist_sq < avoid_dist_sq and dist_sq > 0:
                 # Move directly away from hazard center
-                avoid_vector += normalize_vector(self.pos - hazard.pos)
+                dist = math.sqrt(dist_sq)
+                avoid_x += dx / dist
+                avoid_y += dy / dist
                 num_avoiding += 1
 
         if num_avoiding > 0:
-             avoid_vector = normalize_vector(avoid_vector)
+             avoid_vector = normalize_vector(pygame.Vector2(avoid_x, avoid_y))
              self.vel = avoid_vector * self.speed * 1.5 # Flee faster
-             self.target_angle = avoid_vector.angle_to(pygame.Vector2(1,0)) # Face away
+             self.target_angle = heading_deg(avoid_vector.x, avoid_vector.y) # Face away
              if self.ai_state != AIState.AVOIDING:
                    self.change_state(AIState.AVOIDING)
              # Skip other behaviours while actively avoiding immediate danger
@@ -869,138 +1042,142 @@ class Enemy(Character):
             self.change_state(AIState.IDLE) # Or previous state?
 
 
-        # --- State Transitions ---
-        if self.ai_state == AIState.IDLE:
-            self.vel = pygame.Vector2(0, 0)
-            self.target_angle = (self.target_entity.pos - self.pos).angle_to(pygame.Vector2(1, 0)) # Look at player
-            if player_dist < self.aggro_radius:
-                 # Decide next action based on profile maybe
-                 if self.ai_profile == "aggressive":
-                     self.change_state(AIState.APPROACHING)
-                 elif self.ai_profile == "circler":
-                     self.change_state(AIState.CIRCLING)
-                 else: # Standard/Tester mix
-                     self.change_state(random.choice([AIState.CIRCLING, AIState.APPROACHING, AIState.REPOSITIONING]))
-            # Reset arms
-            if self.left_arm.is_extending: self.left_arm.start_retract()
-            if self.right_arm.is_extending: self.right_arm.start_retract()
-
-
-        elif self.ai_state == AIState.CIRCLING:
-            # Maintain distance, move tangentially
-            self.target_angle = direction_to_player.angle_to(pygame.Vector2(1, 0)) # Keep facing player
-
-            # Vector perpendicular to player direction
-            tangent_vector = direction_to_player.rotate(90 * self.circling_direction)
-
-            # Adjust velocity to maintain distance
-            dist_error = player_dist - self.preferred_circling_distance
-            radial_vel = direction_to_player * dist_error * 0.5 # Move towards/away from player slowly
-            tangential_vel = tangent_vector * self.speed
-
-            self.vel = normalize_vector(tangential_vel + radial_vel) * self.speed
-
-            if self.state_timer <= 0:
-                # Change behaviour: approach, keep circling, reposition?
-                next_state = random.choices(
-                    [AIState.APPROACHING, AIState.CIRCLING, AIState.REPOSITIONING],
-                    weights=[0.5, 0.3, 0.2], k=1)[0]
-                self.change_state(next_state)
-                if next_state == AIState.CIRCLING: # Change direction sometimes
-                    if random.random() < 0.3: self.circling_direction *= -1
-            # Consider attacking if player gets too close during circling
-            elif player_dist < self.attack_radius * 1.2 and self.attack_cooldown <= 0:
-                 if random.random() < 0.1: # Low chance to attack from circling
-                     self.change_state(AIState.ATTACKING)
-
-
-        elif self.ai_state == AIState.APPROACHING:
-            # Move towards player
-            self.target_angle = direction_to_player.angle_to(pygame.Vector2(1, 0))
-            self.vel = direction_to_player * self.speed
-
-            if player_dist <= self.attack_radius:
-                self.change_state(AIState.ATTACKING)
-            elif self.state_timer <= 0: # Took too long? Re-evaluate.
-                self.change_state(AIState.IDLE) # Go back to idle/circling
-
-
-        elif self.ai_state == AIState.ATTACKING:
-            self.vel = pygame.Vector2(0, 0) # Stop to attack
-            self.target_angle = direction_to_player.angle_to(pygame.Vector2(1, 0)) # Face player
-
-            # Simple attack logic: swing one weapon if cooldown ready
-            if self.attack_cooldown <= 0:
-                # Choose which arm to swing (the one with a weapon preferably)
-                can_attack_left = self.left_arm.equipment not in [EquipmentType.SHIELD, EquipmentType.NONE]
-                can_attack_right = self.right_arm.equipment not in [EquipmentType.SHIELD, EquipmentType.NONE]
-                chosen_arm = None
-                if can_attack_left and can_attack_right:
-                    chosen_arm = random.choice([self.left_arm, self.right_arm])
-                elif can_attack_left:
-                    chosen_arm = self.left_arm
-                elif can_attack_right:
-                    chosen_arm = self.right_arm
-                # Else: Has no weapons? Should retreat or use bare hands if implemented for AI
-
-                if chosen_arm:
-                    target_pos = self.target_entity.pos # Aim at player center
-                    arm_target_angle = (target_pos - chosen_arm.shoulder_pos).angle_to(pygame.Vector2(1, 0))
-                    chosen_arm.start_extend(arm_target_angle)
-                    self.attack_cooldown = random.uniform(self.min_attack_interval, self.max_attack_interval)
-                    self.state_timer = 0.5 # Short timer in attack state after swing
-                else:
-                    # No weapon equipped? Maybe try bare hand or retreat
-                    self.change_state(AIState.REPOSITIONING) # Step back
-
-
-            # Retract arms automatically after extension finishes
-            for arm in self.arms:
-                 if arm.is_extending and arm.current_length >= arm.max_length:
-                       arm.start_retract()
-                 elif not arm.is_extending and not arm.is_retracting and arm.current_length > arm.base_length:
-                       # If arm is just hanging out extended (e.g. interrupted), retract it
-                       arm.start_retract()
-
-            # Decide next action after attacking or timer runs out
-            if self.state_timer <= 0:
-                 # Should we reposition, circle, or keep attacking?
-                 if player_dist > self.attack_radius * 1.5: # Player moved away
-                      self.change_state(AIState.APPROACHING)
-                 else:
-                      next_state = random.choices(
-                           [AIState.REPOSITIONING, AIState.CIRCLING, AIState.ATTACKING],
-                           weights=[0.5, 0.3, 0.2], k=1)[0]
-                      self.change_state(next_state)
-
-
-        elif self.ai_state == AIState.REPOSITIONING:
-            # "Testing distance" behaviour - step back or forward
-            if self.move_target_pos is None: # Just entered state
-                # Decide whether to step back or slightly adjust sideways/forward
-                if random.random() < 0.7 or player_dist < self.attack_radius * 0.8: # Mostly step back
-                    step_dir = -direction_to_player
-                else: # Step sideways or slightly forward
-                    step_dir = direction_to_player.rotate(random.uniform(-60, 60))
-                self.move_target_pos = self.pos + step_dir * random.uniform(50, 100)
-
-            # Move towards target position
-            move_vec = self.move_target_pos - self.pos
-            if move_vec.length() < 10 or self.state_timer <= 0:
-                # Reached target or timer expired
-                self.vel = pygame.Vector2(0,0)
-                self.move_target_pos = None
-                # Decide next state (often back to circling or approaching)
-                self.change_state(random.choice([AIState.CIRCLING, AIState.IDLE, AIState.APPROACHING]))
+        # --- State Behaviour (dispatched through the current state's routine) ---
+        self.state_routine(dt, player_dist, direction_to_player)
+
+    def _ai_idle(self, dt, player_dist, direction_to_player):
+        """Look at the player and engage once they come within aggro range."""
+        self.vel = pygame.Vector2(0, 0)
+        self.target_angle = heading_deg(self.target_entity.pos.x - self.pos.x, self.target_entity.pos.y - self.pos.y) # Look at player
+        if player_dist < self.aggro_radius:
+             # Next action depends on profile (resolved once at spawn)
+             if self.engage_state:
+                 self.change_state(self.engage_state)
+             else: # Standard/Tester mix
+                 self.change_state(random.choice([AIState.CIRCLING, AIState.APPROACHING, AIState.REPOSITIONING]))
+        # Reset arms
+        if self.left_arm.is_extending: self.left_arm.start_retract()
+        if self.right_arm.is_extending: self.right_arm.start_retract()
+
+    def _ai_circling(self, dt, player_dist, direction_to_player):
+        """Maintain distance, move tangentially."""
+        self.target_angle = heading_deg(direction_to_player.x, direction_to_player.y) # Keep facing player
+
+        # Vector perpendicular to player direction
+        tangent_vector = direction_to_player.rotate(90 * self.circling_direction)
+
+        # Adjust velocity to maintain distance
+        dist_error = player_dist - self.preferred_circling_distance
+        radial_vel = direction_to_player * dist_error * 0.5 # Move towards/away from player slowly
+        tangential_vel = tangent_vector * self.speed
+
+        self.vel = normalize_vector(tangential_vel + radial_vel) * self.speed
+
+        if self.state_timer <= 0:
+            # Change behaviour: approach, keep circling, reposition?
+            next_state = weighted_choice(*Enemy.AFTER_CIRCLING_CHOICES)
+            self.change_state(next_state)
+            if next_state == AIState.CIRCLING: # Change direction sometimes
+                if random.random() < 0.3: self.circling_direction *= -1
+        # Consider attacking if player gets too close during circling
+        elif player_dist < self.attack_radius * 1.2 and self.attack_cooldown <= 0:
+             if random.random() < 0.1: # Low chance to attack from circling
+                 self.change_state(AIState.ATTACKING)
+
+    def _ai_approaching(self, dt, player_dist, direction_to_player):
+        """Move towards player."""
+        self.target_angle = heading_deg(direction_to_player.x, direction_to_player.y)
+        self.vel = direction_to_player * self.speed
+
+        if player_dist <= self.attack_radius:
+            self.change_state(AIState.ATTACKING)
+        elif self.state_timer <= 0: # Took too long? Re-evaluate.
+            self.change_state(AIState.IDLE) # Go back to idle/circling
+
+    def _ai_attacking(self, dt, player_dist, direction_to_player):
+        """Stand still and swing a blade when the cooldown allows."""
+        self.vel = pygame.Vector2(0, 0) # Stop to attack
+        self.target_angle = heading_deg(direction_to_player.x, direction_to_player.y) # Face player
+
+        # Simple attack logic: swing one weapon if cooldown ready
+        if self.attack_cooldown <= 0:
+            # Choose which arm to swing (the one with a weapon preferably)
+            can_attack_left = self.left_arm.has_blade
+            can_attack_right = self.right_arm.has_blade
+            chosen_arm = None
+            if can_attack_left and can_attack_right:
+                chosen_arm = random.choice([self.left_arm, self.right_arm])
+            elif can_attack_left:
+                chosen_arm = self.left_arm
+            elif can_attack_right:
+                chosen_arm = self.right_arm
+            # Else: Has no weapons? Should retreat or use bare hands if implemented for AI
+
+            if chosen_arm:
+                target_pos = self.target_entity.pos # Aim at player center
+                arm_target_angle = heading_deg(target_pos.x - chosen_arm.shoulder_pos[0], target_pos.y - chosen_arm.shoulder_pos[1])
+                chosen_arm.start_extend(arm_target_angle)
+                self.attack_cooldown = random.uniform(self.min_attack_interval, self.max_attack_interval)
+                self.state_timer = 0.5 # Short timer in attack state after swing
             else:
-                self.vel = normalize_vector(move_vec) * self.speed * 0.8 # Reposition slower
-                self.target_angle = direction_to_player.angle_to(pygame.Vector2(1, 0)) # Keep looking at player
+                # No weapon equipped? Maybe try bare hand or retreat
+                self.change_state(AIState.REPOSITIONING) # Step back
+
+
+        # Retract arms automatically after extension finishes (two arms, so no loop)
+        left_arm = self.left_arm
+        if left_arm.is_extending:
+             if left_arm.current_length >= left_arm.max_length:
+                   left_arm.start_retract()
+        elif not left_arm.is_retracting and left_arm.current_length > left_arm.base_length:
+             # If arm is just hanging out extended (e.g. interrupted), retract it
+             left_arm.start_retract()
+        right_arm = self.right_arm
+        if right_arm.is_extending:
+             if right_arm.current_length >= right_arm.max_length:
+                   right_arm.start_retract()
+        elif not right_arm.is_retracting and right_arm.current_length > right_arm.base_length:
+             right_arm.start_retract()
+
+        # Decide next action after attacking or timer runs out
+        if self.state_timer <= 0:
+             # Should we reposition, circle, or keep attacking?
+             if player_dist > self.attack_radius * 1.5: # Player moved away
+                  self.change_state(AIState.APPROACHING)
+             else:
+                  next_state = weighted_choice(*Enemy.AFTER_ATTACK_CHOICES)
+                  self.change_state(next_state)
+
+    def _ai_repositioning(self, dt, player_dist, direction_to_player):
+        """Testing distance: step back (or sideways/forward) to a point, then pick a new state."""
+        if self.move_target_pos is None: # Just entered state
+            # Decide whether to step back or slightly adjust sideways/forward
+            if random.random() < 0.7 or player_dist < self.attack_radius * 0.8: # Mostly step back
+                step_dir = -direction_to_player
+            else: # Step sideways or slightly forward
+                step_dir = direction_to_player.rotate(random.uniform(-60, 60))
+            self.move_target_pos = self.pos + step_dir * random.uniform(50, 100)
+
+        # Move towards target position
+        move_vec = self.move_target_pos - self.pos
+        if move_vec.length() < 10 or self.state_timer <= 0:
+            # Reached target or timer expired
+            self.vel = pygame.Vector2(0,0)
+            self.move_target_pos = None
+            # Decide next state (often back to circling or approaching)
+            self.change_state(random.choice([AIState.CIRCLING, AIState.IDLE, AIState.APPROACHING]))
+        else:
+            self.vel = normalize_vector(move_vec) * self.speed * 0.8 # Reposition slower
+            self.target_angle = heading_deg(direction_to_player.x, direction_to_player.y) # Keep looking at player
 
+    def _ai_avoiding(self, dt, player_dist, direction_to_player):
+        """Avoidance is steered in run_ai before dispatch; nothing else to do."""
 
     def change_state(self, new_state):
         if self.ai_state != new_state:
             # print(f"Enemy changing from {self.ai_state.name} to {new_state.name}") # Debug
             self.ai_state = new_state
+            self.state_routine = getattr(self, Enemy.STATE_ROUTINES[new_state])
             # Reset timers/targets based on new state
             if new_state == AIState.IDLE:
                 self.state_timer = random.uniform(0.5, 1.5)
@@ -1018,178 +1195,229 @@ class Enemy(Character):
             elif new_state == AIState.AVOIDING:
                  self.state_timer = 0.2 # Short timer, will exit once hazard is clear
 
+    # Per-state behaviour routines (looked up by name, bound in change_state)
+    STATE_ROUTINES = {
+        AIState.IDLE: "_ai_idle",
+        AIState.CIRCLING: "_ai_circling",
+        AIState.APPROACHING: "_ai_approaching",
+        AIState.ATTACKING: "_ai_attacking",
+        AIState.REPOSITIONING: "_ai_repositioning",
+        AIState.AVOIDING: "_ai_avoiding",
+    }
+    # State an enemy engages the player with, by profile; other profiles mix at random
+    ENGAGE_STATES = {
+        "aggressive": AIState.APPROACHING,
+        "circler": AIState.CIRCLING,
+    }
+    # Weighted next-state rolls as (options, cumulative weights), accumulated once here instead of per roll
+    AFTER_CIRCLING_CHOICES = ((AIState.APPROACHING, AIState.CIRCLING, AIState.REPOSITIONING),
+                              tuple(itertools.accumulate((0.5, 0.3, 0.2))))
+    AFTER_ATTACK_CHOICES = ((AIState.REPOSITIONING, AIState.CIRCLING, AIState.ATTACKING),
+                            tuple(itertools.accumulate((0.5, 0.3, 0.2))))
+
 
 # --- Collision Handling ---
-def collide_circle_circle(pos1, r1, pos2, r2):
-    return (pos1 - pos2).length_squared() <= (r1 + r2)**2
+def _circle_circle(x1, y1, r1, x2, y2, r2):
+    dx = x1 - x2
+    dy = y1 - y2
+    return dx * dx + dy * dy <= (r1 + r2) ** 2
 
-def collide_circle_poly(circle_pos, circle_r, poly_points):
-    """Basic circle-polygon collision detection."""
-    if not poly_points: return False
+def _circle_poly(cx, cy, cr, poly_points, bounds=None):
+    """Circle-polygon test on plain floats (no Vector2 per vertex/edge).
+
+    bounds, if given, is the polygon's (min_x, min_y, max_x, max_y); circles clear of it are rejected up front.
+    """
+    if bounds:
+        min_x, min_y, max_x, max_y = bounds
+        if cx + cr < min_x or cx - cr > max_x or cy + cr < min_y or cy - cr > max_y:
+            return False
+
+    r_sq = cr * cr
 
     # 1. Check if circle center is inside polygon (using point_in_poly check)
     # TODO: Implement point_in_poly if needed (more complex)
 
-    # 2. Check if any polygon vertex is inside the circle
-    for p in poly_points:
-        if (pygame.Vector2(p) - circle_pos).length_squared() <= circle_r**2:
+    # 2. Check if circle intersects any polygon edge, in a single pass over the edges
+    # The closest point on an edge is never farther than its endpoints, so this also covers vertex-in-circle
+    x1, y1 = poly_points[-1]
+    for x2, y2 in poly_points:
+        # Find closest point on line segment (p1, p2) to circle center
+        line_x = x2 - x1
+        line_y = y2 - y1
+        len_sq = line_x * line_x + line_y * line_y
+        if len_sq == 0: # Zero-length segment: just the vertex
+            dx = x1 - cx
+            dy = y1 - cy
+        else:
+            t = ((cx - x1) * line_x + (cy - y1) * line_y) / len_sq
+            t = max(0, min(1, t)) # Clamp to segment
+            dx = x1 + line_x * t - cx
+            dy = y1 + line_y * t - cy
+        if dx * dx + dy * dy <= r_sq:
             return True
+        x1 = x2
+        y1 = y2
 
-    # 3. Check if circle intersects any polygon edge
-    for i in range(len(poly_points)):
-        p1 = pygame.Vector2(poly_points[i])
-        p2 = pygame.Vector2(poly_points[(i + 1) % len(poly_points)])
-        # Find closest point on line segment (p1, p2) to circle_pos
-        line_vec = p2 - p1
-        len_sq = line_vec.length_squared()
-        if len_sq == 0: continue # Skip zero-length segments
+    return False
 
-        t = ((circle_pos - p1).dot(line_vec)) / len_sq
-        t = max(0, min(1, t)) # Clamp to segment
 
-        closest_point = p1 + line_vec * t
-        if (closest_point - circle_pos).length_squared() <= circle_r**2:
-            return True
+def _poly_poly(poly1_points, poly2_points):
+    """SAT test for two convex polygons on plain floats."""
+    for edge_poly in (poly1_points, poly2_points):
+        x1, y1 = edge_poly[-1]
+        for x2, y2 in edge_poly:
+            # Edge normal as the candidate separating axis (no need to normalize for an overlap test)
+            axis_x = y1 - y2
+            axis_y = x2 - x1
+            x1 = x2
+            y1 = y2
+            if axis_x == 0 and axis_y == 0: continue # Zero-length edge
 
-    return False
+            # Project both polygons onto the axis
+            proj1 = [px * axis_x + py * axis_y for px, py in poly1_points]
+            proj2 = [px * axis_x + py * axis_y for px, py in poly2_points]
+            if max(proj1) < min(proj2) or max(proj2) < min(proj1):
+                return False # Found a separating axis
 
+    return True
 
 def collide_poly_poly(poly1_points, poly2_points):
-    """Placeholder for SAT (Separating Axis Theorem) collision."""
-    # SAT is complex. Using simple Rect overlap as a *very rough* approximation for now.
-    # This will have many false positives and inaccuracies with rotated shapes.
-    # For a real implementation, a proper SAT library or function is needed.
+    """Separating Axis Theorem collision for convex polygons (arm/equipment shapes)."""
     if not poly1_points or not poly2_points: return False
-    rect1 = get_polygon_rect(poly1_points)
-    rect2 = get_polygon_rect(poly2_points)
-    return rect1.colliderect(rect2)
-
-
-def handle_collisions(entities, obstacles):
-    # ... (broadphase setup) ...
+    return _poly_poly(poly1_points, poly2_points)
+
+
+def _find_contact(e1, e2):
+    """First touching shape pair of two characters as (point, collider1, collider2), or None.
+
+    Shapes are tried body-first in the order body/body, body/arms, then each arm against body and arms.
+    """
+    pos1 = e1.pos
+    pos2 = e2.pos
+    x1, y1 = pos1
+    x2, y2 = pos2
+    r1 = e1.collision_radius
+    r2 = e2.collision_radius
+
+    # Circle-circle fast path (the common case)
+    if _circle_circle(x1, y1, r1, x2, y2, r2):
+        return (pos1 + pos2) / 2, e1, e2
+    for poly2, arm2, bounds2 in e2.collision_polys:
+        if _circle_poly(x1, y1, r1, poly2, bounds2):
+            return pos1, e1, arm2 # Approx point
+    for poly1, arm1, bounds1 in e1.collision_polys:
+        if _circle_poly(x2, y2, r2, poly1, bounds1):
+            return pos2, arm1, e2 # Approx point
+        for poly2, arm2, _ in e2.collision_polys:
+            if collide_poly_poly(poly1, poly2):
+                # Convert centers to vectors for midpoint calculation
+                center1 = pygame.Vector2(get_polygon_rect(poly1).center)
+                center2 = pygame.Vector2(get_polygon_rect(poly2).center)
+                return (center1 + center2) / 2, arm1, arm2
+    return None
+
+
+def handle_collisions(entities, obstacles, obstacle_grid=None):
+    # Characters can still die below (damage), so the loops keep their own is_dead checks
+    entity_list = [entity for entity in entities if not entity.is_dead]
+    if len(entity_list) <= BROADPHASE_MIN_ENTITIES:
+        # Few entities: checking every pair is cheaper than building a grid
+        candidate_pairs = itertools.combinations(range(len(entity_list)), 2)
+    else:
+        # --- Broad phase: bucket entity bounds in a uniform grid ---
+        # Only entities sharing a cell become candidate pairs for the narrow phase below
+        entity_grid = SpatialHashGrid(ENTITY_CELL_SHIFT)
+        for index, entity in enumerate(entity_list):
+            entity_grid.insert(index, entity.collision_aabb)
+        pair_set = set()
+        for bucket in entity_grid.cells.values():
+            if len(bucket) > 1:
+                pair_set.update(itertools.combinations(bucket, 2)) # Buckets are filled in index order, so i < j
+        candidate_pairs = sorted(pair_set) # Same pair order as a full i < j sweep
 
     # --- Entity vs Entity Collisions ---
-    entity_list = list(entities)
-    for i in range(len(entity_list)):
+    for i, j in candidate_pairs:
         e1 = entity_list[i]
-        if e1.is_dead: continue
-
-        for j in range(i + 1, len(entity_list)):
-            e2 = entity_list[j]
-            if e2.is_dead: continue
-
-            # ... (pair checking) ...
-
-            shapes1 = e1.get_collision_shapes()
-            shapes2 = e2.get_collision_shapes()
-
-            collision_occurred = False
-            collision_point = None
-            collider1_obj = None # The object part (Character or Arm)
-            collider2_obj = None
-            collider1_geom = None # The geometry part (pos or poly)
-            collider2_geom = None
-
-            for s1_type, s1_geom, s1_obj in shapes1: # Correct unpacking
-                for s2_type, s2_geom, s2_obj in shapes2: # Correct unpacking
-
-                    collided = False
-                    # --- Perform collision check based on types ---
-                    if s1_type == 'circle' and s2_type == 'circle':
-                        # Pass positions and radii from the objects
-                        collided = collide_circle_circle(s1_geom, s1_obj.collision_radius, s2_geom, s2_obj.collision_radius)
-                        if collided: collision_point = (s1_geom + s2_geom) / 2
-                    elif s1_type == 'circle' and s2_type == 'poly':
-                        collided = collide_circle_poly(s1_geom, s1_obj.collision_radius, s2_geom)
-                        if collided: collision_point = s1_geom # Approx point
-                    elif s1_type == 'poly' and s2_type == 'circle':
-                        collided = collide_circle_poly(s2_geom, s2_obj.collision_radius, s1_geom)
-                        if collided: collision_point = s2_geom # Approx point
-                    elif s1_type == 'poly' and s2_type == 'poly':
-                        collided = collide_poly_poly(s1_geom, s2_geom) # Uses basic rect overlap approx
-                        if collided:
-                            # Convert centers to vectors for midpoint calculation
-                            center1 = pygame.Vector2(get_polygon_rect(s1_geom).center)
-                            center2 = pygame.Vector2(get_polygon_rect(s2_geom).center)
-                            collision_point = (center1 + center2) / 2
-                    # --- Handle Collision Response ---
-                    if collided:
-                        collision_occurred = True
-                        collider1_obj = s1_obj # Store the object
-                        collider2_obj = s2_obj
-                        collider1_geom = s1_geom # Store geometry if needed later
-                        collider2_geom = s2_geom
-                        break
-                if collision_occurred:
-                    break
-
-            # --- Apply Effects based on Collision ---
-            if collision_occurred and collision_point:
-                # 1. General Knockback
-                e1.apply_knockback(KNOCKBACK_SELF_COLLIDE / 2, collision_point)
-                e2.apply_knockback(KNOCKBACK_SELF_COLLIDE / 2, collision_point)
-
-                # 2. Damage and Weapon Effects (Use collider1_obj, collider2_obj)
-                arm1 = collider1_obj if isinstance(collider1_obj, Arm) else None
-                arm2 = collider2_obj if isinstance(collider2_obj, Arm) else None
-                body1_hit = isinstance(collider1_obj, Character)
-                body2_hit = isinstance(collider2_obj, Character)
-
-                # ... (rest of the damage/shield logic using arm1, arm2, body1_hit, body2_hit) ...
-                # Example:
-                if arm1 and arm1.equipment in [EquipmentType.SWORD, EquipmentType.DAGGER]:
-                     if arm2 and arm2.equipment == EquipmentType.SHIELD:
-                         arm2.trigger_shield_hit()
-                         e1.apply_knockback(KNOCKBACK_SELF_COLLIDE * 0.5, collision_point)
-                     else: # Hit body or non-shield arm
-                         damage = 1.0 # Damage per tick (frame)
-                         e2.take_damage(damage, e1.pos)
-                # ... etc ...
+        e2 = entity_list[j]
+        if e1.is_dead or e2.is_dead: continue
+        # Cheap gate: bounds that don't overlap can't have touching shapes
+        if not e1.collision_aabb.colliderect(e2.collision_aabb): continue
+
+        # ... (pair checking) ...
+
+        collision_occurred = False
+        collision_point = None
+        collider1_obj = None # The object part (Character or Arm)
+        collider2_obj = None
+
+        contact = _find_contact(e1, e2)
+        if contact:
+            collision_occurred = True
+            collision_point, collider1_obj, collider2_obj = contact
+
+        # --- Apply Effects based on Collision ---
+        if collision_occurred and collision_point:
+            # 1. General Knockback
+            e1.apply_knockback(KNOCKBACK_SELF_COLLIDE / 2, collision_point)
+            e2.apply_knockback(KNOCKBACK_SELF_COLLIDE / 2, collision_point)
+
+            # 2. Damage and Weapon Effects (Use collider1_obj, collider2_obj)
+            arm1 = collider1_obj if isinstance(collider1_obj, Arm) else None
+            arm2 = collider2_obj if isinstance(collider2_obj, Arm) else None
+            body1_hit = isinstance(collider1_obj, Character)
+            body2_hit = isinstance(collider2_obj, Character)
+
+            # ... (rest of the damage/shield logic using arm1, arm2, body1_hit, body2_hit) ...
+            # Example:
+            if arm1 and arm1.has_blade:
+                 if arm2 and arm2.has_shield:
+                     arm2.trigger_shield_hit()
+                     e1.apply_knockback(KNOCKBACK_SELF_COLLIDE * 0.5, collision_point)
+                 else: # Hit body or non-shield arm
+                     damage = 1.0 # Damage per tick (frame)
+                     e2.take_damage(damage, e1.pos)
+            # ... etc ...
 
 
     # --- Entity vs Obstacle Collisions ---
-    for entity in entities:
+    for entity in entity_list:
         if entity.is_dead: continue
-        entity_shapes = entity.get_collision_shapes()
 
-        for obstacle in obstacles:
+        if obstacle_grid is None:
+            nearby_obstacles = obstacles
+        else:
+            # Grid holds (index, obstacle); sort so obstacles resolve in the same order as the full list.
+            # The query is padded because resolving one obstacle can push the entity a little.
+            query_rect = entity.collision_aabb.inflate(2 * BODY_RADIUS, 2 * BODY_RADIUS)
+            nearby_obstacles = [obstacle for _, obstacle in sorted(obstacle_grid.query(query_rect), key=lambda entry: entry[0])]
+
+        if not nearby_obstacles: continue
+
+        # Body circle first, then each arm approximated by a circle around its polygon (built once per entity)
+        # The body center is entity.pos itself, so it follows any push applied below
+        entity_circles = [(entity.pos, entity.collision_radius)]
+        for poly_points, _, _ in entity.collision_polys:
+            center_x = sum(p[0] for p in poly_points)/len(poly_points)
+            center_y = sum(p[1] for p in poly_points)/len(poly_points)
+            poly_radius = math.sqrt(max((px - center_x)**2 + (py - center_y)**2 for px, py in poly_points))
+            entity_circles.append((pygame.Vector2(center_x, center_y), poly_radius))
+
+        for obstacle in nearby_obstacles:
              # Obstacle is assumed to be a circle here
              obstacle_pos = obstacle.pos
+             obstacle_x, obstacle_y = obstacle_pos
              obstacle_radius = obstacle.radius
 
-             for e_type, e_geom, e_obj in entity_shapes: # Correct unpacking
-                 collided = False
-                 collision_normal = None
-                 overlap = 0
-
-                 if e_type == 'circle':
-                     # e_geom is the position (Vector2), e_obj is the Character
-                     # Pass the correct position and radius for the entity circle
-                     collided = collide_circle_circle(e_geom, e_obj.collision_radius, obstacle_pos, obstacle_radius)
-                     if collided:
-                         collision_normal = normalize_vector(e_geom - obstacle_pos)
-                         # Calculate overlap
-                         dist = (e_geom - obstacle_pos).length()
-                         overlap = (e_obj.collision_radius + obstacle_radius) - dist
-
-                 elif e_type == 'poly':
-                      # e_geom is the list of polygon points, e_obj is the Arm
-                      poly_points = e_geom
-                      if not poly_points: continue # Skip if poly is empty
-
-                      # Use circle approx for entity arm vs obstacle circle for simplicity
-                      poly_center = pygame.Vector2(sum(p[0] for p in poly_points)/len(poly_points), sum(p[1] for p in poly_points)/len(poly_points))
-                      poly_radius = max((pygame.Vector2(p) - poly_center).length() for p in poly_points)
-
-                      collided = collide_circle_circle(poly_center, poly_radius, obstacle_pos, obstacle_radius)
-                      if collided:
-                          collision_normal = normalize_vector(poly_center - obstacle_pos)
-                          # Calculate overlap for the approximation
-                          dist = (poly_center - obstacle_pos).length()
-                          overlap = (poly_radius + obstacle_radius) - dist
+             for circle_pos, circle_radius in entity_circles:
+                 if not _circle_circle(circle_pos.x, circle_pos.y, circle_radius, obstacle_x, obstacle_y, obstacle_radius):
+                     continue
+                 offset = circle_pos - obstacle_pos
+                 collision_normal = normalize_vector(offset)
+                 # Calculate overlap
+                 overlap = (circle_radius + obstacle_radius) - offset.length()
 
                  # Resolve collision: Push entity out of obstacle
-                 if collided and collision_normal and overlap > 0:
+                 if collision_normal and overlap > 0:
                       entity.pos += collision_normal * overlap
                       # Dampen velocity component into the obstacle
                       vel_proj = entity.vel.dot(collision_normal)
@@ -1242,6 +1470,9 @@ class Game:
         self.player_kills = 0
         self.game_time = 0.0
         self.campfire = None # <--- ADD THIS LINE
+        self.static_layer = None # Obstacles and trunks, baked once per game in start_playing
+        self.ground_layer = None # Background fill plus cobblestones, baked once per game in start_playing
+        self.view_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT) # World area on screen (set in draw), for culling
 
         # Sprite Groups (Layering)
         self.sprite_groups = {
@@ -1249,20 +1480,27 @@ class Game:
             "collidables": pygame.sprite.Group(),    # Player, Enemies, Obstacles
             "obstacles": pygame.sprite.Group(),      # Static obstacles only
             "characters": pygame.sprite.Group(),     # Player, Enemies
+            "draw_sorted": pygame.sprite.LayeredUpdates(), # Player, Enemies, layered by int(pos.y) for draw order
             "roof_objects": pygame.sprite.Group(),   # Tree foliage
             "hazards": pygame.sprite.Group(),        # Campfire (for damage check)
-            "blood_splatters_group": pygame.sprite.Group(), # For drawing splatters
             "all_draw": pygame.sprite.Group()        # For potentially easier drawing? maybe remove
         }
         # Pass self to groups if needed for callbacks/access
         for group in self.sprite_groups.values():
             group.game = self # Give groups access back to the main game instance
 
-        self.ground_cobblestones = []
+        self.blood_splatters = BloodSplatterPool()
+        # Broad-phase grids, reused across frames: characters are re-inserted every tick, hazards once per game
+        self.character_grid = SpatialHashGrid()
+        self.hazard_grid = SpatialHashGrid()
+        self.obstacle_grid = SpatialHashGrid(ENTITY_CELL_SHIFT)
+        self.hazard_xs, self.hazard_ys, self.hazard_avoid_dist_sqs = [], [], []
+        # Cobblestones as parallel lists: x, y, radius, color
+        self.cobble_xs, self.cobble_ys, self.cobble_radii, self.cobble_colors = [], [], [], []
         self.setup_start_menu()
         self.selected_equipment = {Hand.LEFT: EquipmentType.NONE, Hand.RIGHT: EquipmentType.NONE}
         self.spawn_timer = INITIAL_SPAWN_DELAY
-        self.high_score = self.load_highscore()
+        self.high_score = self.load_highscore() # Read once; kept in memory and only written when beaten
 
 
     def load_highscore(self):
@@ -1276,8 +1514,10 @@ class Game:
          if self.player_kills > self.high_score:
               self.high_score = self.player_kills
               try:
-                  with open("highscore.txt", "w") as f:
+                  # Write a temp file and swap it in, so a crash mid-write can't leave a truncated score
+                  with open("highscore.txt.tmp", "w") as f:
                       f.write(str(self.high_score))
+                  os.replace("highscore.txt.tmp", "highscore.txt")
               except IOError:
                    print("Error saving highscore.")
 
@@ -1355,11 +1595,12 @@ class Game:
         self.player_kills = 0
         for group in self.sprite_groups.values():
             group.empty() # Clear all sprites
-        self.ground_cobblestones = [] # Clear ground graphics
+        self.blood_splatters.clear()
+        self.cobble_xs, self.cobble_ys, self.cobble_radii, self.cobble_colors = [], [], [], [] # Clear ground graphics
 
         # --- Create Player ---
         self.player = Player((SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2),
-                             [self.sprite_groups["collidables"], self.sprite_groups["characters"]])
+                             [self.sprite_groups["collidables"], self.sprite_groups["characters"], self.sprite_groups["draw_sorted"]])
         self.player.equip(self.selected_equipment[Hand.LEFT], self.selected_equipment[Hand.RIGHT])
 
         # --- Create Environment ---
@@ -1368,7 +1609,16 @@ class Game:
             x = random.randint(-200, SCREEN_WIDTH + 200) # Extend beyond screen for camera movement
             y = random.randint(-200, SCREEN_HEIGHT + 200)
             r = random.randint(5, 25)
-            self.ground_cobblestones.append(Cobblestone((x, y), r))
+            self.cobble_xs.append(x)
+            self.cobble_ys.append(y)
+            self.cobble_radii.append(r)
+            self.cobble_colors.append(random.choice([GREY, DARK_GREY, LIGHT_GREY]))
+
+        # The ground never changes during a game, so draw it once (covering the whole cobblestone area)
+        self.ground_layer = pygame.Surface((SCREEN_WIDTH + 2 * GROUND_MARGIN, SCREEN_HEIGHT + 2 * GROUND_MARGIN)).convert()
+        self.ground_layer.fill(DARK_GREY) # Base background
+        for x, y, r, color in zip(self.cobble_xs, self.cobble_ys, self.cobble_radii, self.cobble_colors):
+            pygame.draw.circle(self.ground_layer, color, (x + GROUND_MARGIN, y + GROUND_MARGIN), r)
 
         # Obstacles (Rocks)
         for _ in range(10):
@@ -1395,7 +1645,26 @@ class Game:
 
         # Campfire
         campfire_pos = (SCREEN_WIDTH * 0.8, SCREEN_HEIGHT * 0.2)
-        self.campfire = Campfire(campfire_pos, 50, [self.sprite_groups["hazards"]])
+        self.campfire = Campfire(campfire_pos, 50, [self.sprite_groups["hazards"], self.sprite_groups["ground_effects"]]) # ground_effects drives the bob
+        self.hazard_grid.clear()
+        for hazard in self.sprite_groups["hazards"]:
+            self.hazard_grid.insert(hazard, hazard.hazard_shape)
+        # Hazard columns for enemy avoidance: center x, center y, squared avoid distance (approx check distance)
+        self.hazard_xs = [hazard.pos.x for hazard in self.sprite_groups["hazards"]]
+        self.hazard_ys = [hazard.pos.y for hazard in self.sprite_groups["hazards"]]
+        self.hazard_avoid_dist_sqs = [(ENEMY_AVOID_RADIUS + hazard.half_size)**2 for hazard in self.sprite_groups["hazards"]]
+
+        # Static obstacles never move, so draw them once into a colorkeyed layer
+        self.static_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.static_layer.fill(STATIC_LAYER_KEY)
+        self.static_layer.set_colorkey(STATIC_LAYER_KEY, pygame.RLEACCEL)
+        for obstacle in self.sprite_groups["obstacles"]:
+            obstacle.draw_to_static(self.static_layer)
+
+        # Obstacles are static too, so their broad-phase grid is built once per game
+        self.obstacle_grid.clear()
+        for index, obstacle in enumerate(self.sprite_groups["obstacles"]):
+            self.obstacle_grid.insert((index, obstacle), obstacle.rect)
 
 
         self.spawn_timer = INITIAL_SPAWN_DELAY
@@ -1413,6 +1682,17 @@ class Game:
     def quit_game(self):
         self.running = False
 
+    def apply_hazards(self, dt):
+        """Damage-over-time for every living character standing in a hazard (e.g., campfire)."""
+        hazard_grid = self.hazard_grid
+        for char in self.sprite_groups["characters"]:
+            if char.is_dead:
+                continue
+            pos = char.pos
+            for hazard in hazard_grid.query_point(pos):
+                if hazard.hazard_shape.collidepoint(pos):
+                    char.take_damage(hazard.damage * dt, hazard.pos, apply_knockback=False)
+
     # --- Spawning Logic ---
     def update_spawning(self, dt):
         self.spawn_timer -= dt
@@ -1454,7 +1734,7 @@ class Game:
         # Choose random AI profile
         ai_profile = random.choice(["standard", "aggressive", "circler", "tester"])
 
-        enemy = Enemy((x, y), [self.sprite_groups["collidables"], self.sprite_groups["characters"]], ai_profile=ai_profile)
+        enemy = Enemy((x, y), [self.sprite_groups["collidables"], self.sprite_groups["characters"], self.sprite_groups["draw_sorted"]], ai_profile=ai_profile)
 
         # Randomly equip enemy (no two shields, must have weapon)
         possible_weapons = [EquipmentType.SWORD, EquipmentType.DAGGER]
@@ -1493,17 +1773,32 @@ class Game:
             self.game_time += dt
 
             # Update characters and other dynamic objects
-            self.sprite_groups["characters"].update(dt, self.sprite_groups["collidables"], self.sprite_groups["hazards"])
+            # Poll the mouse once per frame for all characters (only the Player reads it)
+            mouse_pos = pygame.mouse.get_pos()
+            mouse_buttons = pygame.mouse.get_pressed()
+            self.sprite_groups["characters"].update(dt, self.sprite_groups["collidables"], self.sprite_groups["hazards"], mouse_pos, mouse_buttons, self.player)
             self.sprite_groups["ground_effects"].update(dt) # Campfire anim, blood fade
-            self.sprite_groups["blood_splatters_group"].update(dt)
+            self.blood_splatters.update(dt)
+            self.apply_hazards(dt)
 
             # Update roof transparency based on character positions
-            character_rects = [char.body_rect_for_roof for char in self.sprite_groups["characters"]]
+            self.character_grid.clear()
+            for char in self.sprite_groups["characters"]:
+                inflated_rect = char.body_rect_for_roof.inflate(20, 20)
+                self.character_grid.insert(inflated_rect, inflated_rect)
             for roof in self.sprite_groups["roof_objects"]:
-                roof.update_transparency(character_rects)
+                if roof.rect.colliderect(self.view_rect): # Off-screen foliage can't be seen fading
+                    roof.update_transparency(self.character_grid)
 
             # Collision Detection and Response
-            handle_collisions(self.sprite_groups["characters"], self.sprite_groups["obstacles"])
+            handle_collisions(self.sprite_groups["characters"], self.sprite_groups["obstacles"], self.obstacle_grid)
+
+            # Keep the draw order current: move a character's layer only when its row changes
+            draw_sorted = self.sprite_groups["draw_sorted"]
+            for char in self.sprite_groups["characters"]:
+                layer = int(char.pos.y)
+                if layer != char._layer:
+                    draw_sorted.change_layer(char, layer)
 
             # Enemy Spawning
             self.update_spawning(dt)
@@ -1519,30 +1814,36 @@ class Game:
         # cam_y = SCREEN_HEIGHT / 2 - self.player.pos.y if self.player else 0
         # camera_offset = pygame.Vector2(cam_x, cam_y)
         camera_offset = pygame.Vector2(0, 0) # No camera movement yet
+        self.view_rect.topleft = (-camera_offset.x, -camera_offset.y)
+        # Cull with a margin: characters may have been pushed after their bounds were cached, and the fire bobs
+        cull_rect = self.view_rect.inflate(4 * BODY_RADIUS, 4 * BODY_RADIUS)
 
         # ---- DRAWING ORDER ----
-        # 1. Ground Layer
-        self.screen.fill(DARK_GREY) # Base background
-        for stone in self.ground_cobblestones:
-            pygame.draw.circle(self.screen, stone.color, stone.pos + camera_offset, stone.radius)
+        # 1. Ground Layer (baked once per game)
+        if self.ground_layer:
+            self.screen.blit(self.ground_layer, (camera_offset.x - GROUND_MARGIN, camera_offset.y - GROUND_MARGIN))
+        else:
+            self.screen.fill(DARK_GREY) # Base background
 
         # 2. Splatter Layer (Campfire GFX, Blood)
         # Manually draw the campfire using its own draw method
-        if self.campfire: # Make sure it exists
+        if self.campfire and self.campfire.rect.colliderect(cull_rect): # Make sure it exists (and is on screen)
             self.campfire.draw(self.screen, camera_offset)
-        # Draw blood splatters using the group draw method (BloodSplatter sets self.image)
-        self.sprite_groups["blood_splatters_group"].draw(self.screen, camera_offset)
+        self.blood_splatters.draw(self.screen, camera_offset)
 
 
-        # 3. Object Layer (Characters, Obstacles)
-        # Sort by Y for pseudo-depth? Optional.
-        sprites_to_draw = sorted(self.sprite_groups["collidables"], key=lambda spr: spr.pos.y)
-        for sprite in sprites_to_draw:
-            sprite.draw(self.screen, camera_offset)
+        # 3. Object Layer (Obstacles baked once, then Characters)
+        if self.static_layer:
+            self.screen.blit(self.static_layer, camera_offset)
+        # Y-sorted for pseudo-depth; the layered group keeps that order between frames
+        for sprite in self.sprite_groups["draw_sorted"]:
+            if sprite.collision_aabb.colliderect(cull_rect): # Skip characters fully off screen
+                sprite.draw(self.screen, camera_offset)
 
         # 4. Roof Layer (Tree Foliage)
         for roof in self.sprite_groups["roof_objects"]:
-            roof.draw(self.screen, camera_offset) # Uses potentially adjusted alpha
+            if roof.rect.colliderect(self.view_rect):
+                roof.draw(self.screen, camera_offset) # Uses potentially adjusted alpha
 
 
         # --- UI / Game State Specific Drawing ---